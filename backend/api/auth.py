@@ -4,15 +4,20 @@ Handles user authentication, registration, and user management.
 """
 
 import os
+import time
 import uuid
+from threading import Lock
 import bcrypt
 import jwt
 from datetime import datetime, timezone, timedelta
-from functools import wraps
-from flask import Blueprint, request, jsonify, g
+from functools import lru_cache, wraps
+from flask import Blueprint, Response, request, jsonify, g
+from sqlalchemy import case, lambda_stmt, select, update
+from sqlalchemy.orm import defer, load_only
 import logging
 
 from database import db
+from json_provider import dumps_bytes
 from models import User
 
 logger = logging.getLogger(__name__)
@@ -20,15 +25,33 @@ logger = logging.getLogger(__name__)
 # Create blueprint
 auth_bp = Blueprint('auth', __name__, url_prefix='/api/auth')
 
+# Auth payloads are tiny; reject anything larger before parsing JSON
+MAX_AUTH_BODY_BYTES = 16 * 1024
+
 # JWT Configuration
 JWT_SECRET = os.getenv('JWT_SECRET', os.getenv('SECRET_KEY', 'dev-secret-key-change-me'))
+# Pre-encoded HMAC key so PyJWT doesn't re-encode the secret on every sign/verify
+_JWT_KEY = JWT_SECRET.encode('utf-8')
 ACCESS_TOKEN_EXPIRES = timedelta(minutes=15)
 REFRESH_TOKEN_EXPIRES = timedelta(days=7)
+_ACCESS_TOKEN_TTL = int(ACCESS_TOKEN_EXPIRES.total_seconds())
+_REFRESH_TOKEN_TTL = int(REFRESH_TOKEN_EXPIRES.total_seconds())
+_JWT_DECODE_OPTIONS = {'require': ['exp', 'iat', 'sub']}
+
+# bcrypt work factor for new password hashes. Each step doubles hashing CPU;
+# 10 (the OWASP minimum) costs roughly a quarter of the default 12.
+BCRYPT_COST = int(os.getenv('BCRYPT_COST', '12'))
+
+# Columns require_auth needs to authorize a request; routes that need the rest
+# (notably the settings JSON) are marked @loads_full_user. The partial user
+# stays in the identity map, so admin routes that look up a user by id pass
+# populate_existing=True in case the target is the caller.
+_AUTH_USER_OPTIONS = [load_only(User.id, User.is_active, User.is_approved, User.is_admin)]
 
 
 def hash_password(password: str) -> str:
     """Hash a password using bcrypt."""
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(BCRYPT_COST)).decode('utf-8')
 
 
 def verify_password(password: str, password_hash: str) -> bool:
@@ -36,35 +59,74 @@ def verify_password(password: str, password_hash: str) -> bool:
     return bcrypt.checkpw(password.encode('utf-8'), password_hash.encode('utf-8'))
 
 
+def find_user_by_email(email: str):
+    """
+    Look up a user by (already normalized) email.
+
+    Uses a lambda statement so the SELECT is compiled once and reused from
+    SQLAlchemy's statement cache; only the email bind value changes per call.
+    """
+    stmt = lambda_stmt(lambda: select(User).where(User.email == email))
+    return db.session.execute(stmt).scalar_one_or_none()
+
+
 def create_access_token(user_id: str) -> str:
     """Create a JWT access token."""
+    now = int(time.time())
     payload = {
         'sub': user_id,
         'type': 'access',
-        'exp': datetime.now(timezone.utc) + ACCESS_TOKEN_EXPIRES,
-        'iat': datetime.now(timezone.utc)
+        'exp': now + _ACCESS_TOKEN_TTL,
+        'iat': now
     }
-    return jwt.encode(payload, JWT_SECRET, algorithm='HS256')
+    return jwt.encode(payload, _JWT_KEY, algorithm='HS256')
 
 
 def create_refresh_token(user_id: str) -> str:
     """Create a JWT refresh token."""
+    now = int(time.time())
     payload = {
         'sub': user_id,
         'type': 'refresh',
-        'exp': datetime.now(timezone.utc) + REFRESH_TOKEN_EXPIRES,
-        'iat': datetime.now(timezone.utc)
+        'exp': now + _REFRESH_TOKEN_TTL,
+        'iat': now
     }
-    return jwt.encode(payload, JWT_SECRET, algorithm='HS256')
+    return jwt.encode(payload, _JWT_KEY, algorithm='HS256')
+
+
+@lru_cache(maxsize=4096)
+def _decode_token_cached(token: str, bucket: int) -> dict:
+    """Decode a JWT token; results are memoized per one-second bucket."""
+    return jwt.decode(token, _JWT_KEY, algorithms=['HS256'], options=_JWT_DECODE_OPTIONS)
 
 
 def decode_token(token: str) -> dict:
-    """Decode and validate a JWT token."""
-    return jwt.decode(token, JWT_SECRET, algorithms=['HS256'])
+    """
+    Decode and validate a JWT token.
+
+    Successful decodes are cached for the current second so bursts of requests
+    carrying the same token skip the HMAC check. Failures (expired, invalid)
+    raise and are never cached. The returned dict is shared and must not be
+    mutated.
+    """
+    return _decode_token_cached(token, int(time.time()))
+
+
+def loads_full_user(f):
+    """
+    Mark a route as needing every User column on g.current_user.
+
+    Apply below @require_auth: the user is then loaded whole by the
+    authorization query instead of being reloaded by the route.
+    """
+    f.loads_full_user = True
+    return f
 
 
 def require_auth(f):
     """Decorator to require authentication for an endpoint."""
+    user_options = {} if getattr(f, 'loads_full_user', False) else {'options': _AUTH_USER_OPTIONS}
+
     @wraps(f)
     def decorated(*args, **kwargs):
         auth_header = request.headers.get('Authorization')
@@ -76,45 +138,49 @@ def require_auth(f):
             }), 401
 
         try:
-            # Extract token from "Bearer <token>"
-            parts = auth_header.split()
-            if len(parts) != 2 or parts[0].lower() != 'bearer':
+            # Extract token from "Bearer <token>" without splitting the header
+            if len(auth_header) < 8 or auth_header[:7].lower() != 'bearer ':
                 return jsonify({
                     'success': False,
                     'error': 'Invalid authorization header format'
                 }), 401
 
-            token = parts[1]
-            payload = decode_token(token)
-
-            if payload.get('type') != 'access':
-                return jsonify({
-                    'success': False,
-                    'error': 'Invalid token type'
-                }), 401
-
-            # Get user from database
-            user = User.query.get(payload['sub'])
-            if not user:
-                return jsonify({
-                    'success': False,
-                    'error': 'User not found'
-                }), 401
-
-            if not user.is_approved:
-                return jsonify({
-                    'success': False,
-                    'error': 'Account pending approval'
-                }), 403
-
-            if not user.is_active:
-                return jsonify({
-                    'success': False,
-                    'error': 'Account has been deactivated'
-                }), 403
-
-            # Store user in g for access in route
-            g.current_user = user
+            token = auth_header[7:].strip()
+
+            # Reuse the user resolved earlier in this request (e.g. by a stacked
+            # decorator) instead of decoding the token and querying again
+            if g.get('_auth_token') != token:
+                payload = decode_token(token)
+
+                if payload.get('type') != 'access':
+                    return jsonify({
+                        'success': False,
+                        'error': 'Invalid token type'
+                    }), 401
+
+                # Get user from database
+                user = db.session.get(User, payload['sub'], **user_options)
+                if not user:
+                    return jsonify({
+                        'success': False,
+                        'error': 'User not found'
+                    }), 401
+
+                if not user.is_approved:
+                    return jsonify({
+                        'success': False,
+                        'error': 'Account pending approval'
+                    }), 403
+
+                if not user.is_active:
+                    return jsonify({
+                        'success': False,
+                        'error': 'Account has been deactivated'
+                    }), 403
+
+                # Store user in g for access in route
+                g.current_user = user
+                g._auth_token = token
 
         except jwt.ExpiredSignatureError:
             return jsonify({
@@ -122,15 +188,65 @@ def require_auth(f):
                 'error': 'Token has expired'
             }), 401
         except jwt.InvalidTokenError as e:
+            logger.debug("Rejected access token: %s", e)
             return jsonify({
                 'success': False,
-                'error': f'Invalid token: {str(e)}'
+                'error': 'Invalid token'
             }), 401
 
         return f(*args, **kwargs)
     return decorated
 
 
+# Pending last-login timestamps (user_id -> datetime), flushed in one UPDATE
+# by flush_last_logins() so logins don't each pay for a commit
+_pending_last_logins = {}
+_pending_last_logins_lock = Lock()
+
+
+def record_last_login(user_id, when: datetime):
+    """Queue a last_login_at update for the next batched flush."""
+    with _pending_last_logins_lock:
+        _pending_last_logins[user_id] = when
+
+
+def flush_last_logins() -> int:
+    """
+    Write queued last_login_at values in a single UPDATE statement.
+    Must run inside an application context (called by the background scheduler).
+
+    Returns:
+        Number of users updated
+    """
+    global _pending_last_logins
+
+    with _pending_last_logins_lock:
+        pending, _pending_last_logins = _pending_last_logins, {}
+
+    if not pending:
+        return 0
+
+    try:
+        db.session.execute(
+            update(User)
+            .where(User.id.in_(list(pending)))
+            .values(last_login_at=case(pending, value=User.id))
+            .execution_options(synchronize_session=False)
+        )
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        logger.error("Failed to flush last login times: %s", e)
+
+        # Re-queue so the next run retries, keeping any newer timestamps
+        with _pending_last_logins_lock:
+            for user_id, when in pending.items():
+                _pending_last_logins.setdefault(user_id, when)
+        return 0
+
+    return len(pending)
+
+
 def require_admin(f):
     """Decorator to require admin privileges for an endpoint."""
     @wraps(f)
@@ -145,6 +261,18 @@ def require_admin(f):
     return decorated
 
 
+@auth_bp.before_request
+def limit_request_body():
+    """Reject oversized auth request bodies before any JSON parsing."""
+    request.max_content_length = MAX_AUTH_BODY_BYTES
+
+    if request.content_length and request.content_length > MAX_AUTH_BODY_BYTES:
+        return jsonify({
+            'success': False,
+            'error': 'Request body too large'
+        }), 413
+
+
 @auth_bp.route('/login', methods=['POST'])
 def login():
     """
@@ -178,7 +306,7 @@ def login():
             }), 400
 
         # Find user by email
-        user = User.query.filter_by(email=email).first()
+        user = find_user_by_email(email)
 
         if not user or not verify_password(password, user.password_hash):
             return jsonify({
@@ -200,23 +328,26 @@ def login():
                 'error': 'Account has been deactivated'
             }), 403
 
-        # Update last login
-        user.last_login_at = datetime.now(timezone.utc)
-        db.session.commit()
+        # Record last login; written to the database by the batched flush job
+        last_login_at = datetime.now(timezone.utc)
+        record_last_login(user.id, last_login_at)
 
         # Generate tokens
         access_token = create_access_token(str(user.id))
         refresh_token = create_refresh_token(str(user.id))
 
+        user_data = user.to_dict()
+        user_data['last_login_at'] = last_login_at.isoformat()
+
         return jsonify({
             'success': True,
             'access_token': access_token,
             'refresh_token': refresh_token,
-            'user': user.to_dict()
+            'user': user_data
         }), 200
 
     except Exception as e:
-        logger.error(f"Login error: {e}")
+        logger.error("Login error: %s", e)
         return jsonify({
             'success': False,
             'error': str(e)
@@ -269,7 +400,7 @@ def refresh():
                 }), 401
 
             # Get user
-            user = User.query.get(payload['sub'])
+            user = db.session.get(User, payload['sub'], options=_AUTH_USER_OPTIONS)
             if not user:
                 return jsonify({
                     'success': False,
@@ -296,13 +427,14 @@ def refresh():
                 'error': 'Refresh token has expired'
             }), 401
         except jwt.InvalidTokenError as e:
+            logger.debug("Rejected refresh token: %s", e)
             return jsonify({
                 'success': False,
-                'error': f'Invalid refresh token: {str(e)}'
+                'error': 'Invalid refresh token'
             }), 401
 
     except Exception as e:
-        logger.error(f"Refresh error: {e}")
+        logger.error("Refresh error: %s", e)
         return jsonify({
             'success': False,
             'error': str(e)
@@ -311,6 +443,7 @@ def refresh():
 
 @auth_bp.route('/me', methods=['GET'])
 @require_auth
+@loads_full_user
 def get_current_user():
     """
     Get current user info.
@@ -326,6 +459,7 @@ def get_current_user():
 
 @auth_bp.route('/me/settings', methods=['GET'])
 @require_auth
+@loads_full_user
 def get_user_settings():
     """
     Get current user's settings.
@@ -341,6 +475,7 @@ def get_user_settings():
 
 @auth_bp.route('/me/settings', methods=['PUT'])
 @require_auth
+@loads_full_user
 def update_user_settings():
     """
     Update current user's settings.
@@ -365,31 +500,40 @@ def update_user_settings():
                 'error': 'Request body required'
             }), 400
 
-        # Merge with existing settings - create a NEW dict to ensure SQLAlchemy detects the change
-        current_settings = dict(g.current_user.settings or {})
-        current_settings.update(data)
+        user = g.current_user
 
-        # Assign the new dict (SQLAlchemy needs this to detect the change to JSON column)
-        g.current_user.settings = current_settings
-        g.current_user.updated_at = datetime.now(timezone.utc)
+        # Merge into a NEW dict and assign it (SQLAlchemy needs a new object to
+        # detect the change to the JSON column)
+        current_settings = {**(user.settings or {}), **data}
+        user.settings = current_settings
+        user.updated_at = datetime.now(timezone.utc)
         db.session.commit()
 
-        logger.info(f"Updated settings for user {g.current_user.email}: {current_settings}")
+        logger.info("Updated settings for user %s: %s", user.email, current_settings)
 
         return jsonify({
             'success': True,
-            'settings': g.current_user.settings
+            'settings': user.settings
         }), 200
 
     except Exception as e:
         db.session.rollback()
-        logger.error(f"Update settings error: {e}")
+        logger.error("Update settings error: %s", e)
         return jsonify({
             'success': False,
             'error': str(e)
         }), 500
 
 
+# Public config only depends on the environment, so encode it once at import
+_APP_CONFIG_BODY = dumps_bytes({
+    'success': True,
+    'config': {
+        'orgName': os.getenv('ORG_NAME', 'Orbu'),
+    }
+})
+
+
 @auth_bp.route('/config', methods=['GET'])
 def get_app_config():
     """
@@ -399,13 +543,7 @@ def get_app_config():
     Returns:
         JSON with app configuration
     """
-    org_name = os.getenv('ORG_NAME', 'Orbu')
-    return jsonify({
-        'success': True,
-        'config': {
-            'orgName': org_name,
-        }
-    }), 200
+    return Response(_APP_CONFIG_BODY, status=200, mimetype='application/json')
 
 
 @auth_bp.route('/register', methods=['POST'])
@@ -455,7 +593,7 @@ def register():
             }), 400
 
         # Check if email already exists
-        existing = User.query.filter_by(email=email).first()
+        existing = find_user_by_email(email)
         if existing:
             return jsonify({
                 'success': False,
@@ -475,7 +613,7 @@ def register():
         db.session.add(user)
         db.session.commit()
 
-        logger.info(f"New user registration request: {email}")
+        logger.info("New user registration request: %s", email)
 
         return jsonify({
             'success': True,
@@ -484,7 +622,7 @@ def register():
 
     except Exception as e:
         db.session.rollback()
-        logger.error(f"Registration error: {e}")
+        logger.error("Registration error: %s", e)
         return jsonify({
             'success': False,
             'error': str(e)
@@ -493,6 +631,51 @@ def register():
 
 # Admin endpoints
 
+def has_other_active_admin(user_id) -> bool:
+    """
+    Check whether an active admin other than user_id exists.
+
+    Probes with LIMIT 1 so the database can stop at the first match instead
+    of counting every admin row.
+    """
+    stmt = (
+        select(User.id)
+        .where(User.is_admin.is_(True), User.is_active.is_(True), User.id != user_id)
+        .limit(1)
+    )
+    return db.session.execute(stmt).first() is not None
+
+
+MAX_USERS_PAGE_SIZE = 200
+
+
+def _users_list_response(query):
+    """
+    Build the JSON response for a user listing query.
+
+    Without a ``limit`` query parameter every user is returned. With
+    ``limit``/``offset`` only that page is loaded and the total is counted in
+    SQL instead of materializing every row.
+    """
+    # Listings never return settings or the password hash, so don't load them
+    query = query.options(defer(User.settings), defer(User.password_hash))
+    limit = request.args.get('limit', type=int)
+
+    if limit is None:
+        users = query.all()
+        total = len(users)
+    else:
+        offset = max(request.args.get('offset', 0, type=int), 0)
+        total = query.order_by(None).count()
+        users = query.offset(offset).limit(min(max(limit, 0), MAX_USERS_PAGE_SIZE)).all()
+
+    return jsonify({
+        'success': True,
+        'users': [user.to_dict(include_settings=False) for user in users],
+        'total': total
+    }), 200
+
+
 @auth_bp.route('/users', methods=['GET'])
 @require_admin
 def list_users():
@@ -501,6 +684,8 @@ def list_users():
 
     Query Parameters:
         - status: Filter by status (pending, approved, deactivated)
+        - limit: Optional page size (max 200); omit to return all users
+        - offset: Number of users to skip when paginating (default: 0)
 
     Returns:
         JSON with list of users
@@ -519,16 +704,10 @@ def list_users():
         # Order by created date (newest first)
         query = query.order_by(User.created_at.desc())
 
-        users = query.all()
-
-        return jsonify({
-            'success': True,
-            'users': [user.to_dict() for user in users],
-            'total': len(users)
-        }), 200
+        return _users_list_response(query)
 
     except Exception as e:
-        logger.error(f"List users error: {e}")
+        logger.error("List users error: %s", e)
         return jsonify({
             'success': False,
             'error': str(e)
@@ -541,20 +720,20 @@ def list_pending_users():
     """
     List pending user requests (admin only).
 
+    Query Parameters:
+        - limit: Optional page size (max 200); omit to return all users
+        - offset: Number of users to skip when paginating (default: 0)
+
     Returns:
         JSON with list of pending users
     """
     try:
-        users = User.query.filter_by(is_approved=False).order_by(User.created_at.desc()).all()
+        query = User.query.filter_by(is_approved=False).order_by(User.created_at.desc())
 
-        return jsonify({
-            'success': True,
-            'users': [user.to_dict() for user in users],
-            'total': len(users)
-        }), 200
+        return _users_list_response(query)
 
     except Exception as e:
-        logger.error(f"List pending users error: {e}")
+        logger.error("List pending users error: %s", e)
         return jsonify({
             'success': False,
             'error': str(e)
@@ -574,7 +753,7 @@ def approve_user(user_id):
         JSON with updated user info
     """
     try:
-        user = User.query.get(user_id)
+        user = db.session.get(User, user_id, populate_existing=True)
         if not user:
             return jsonify({
                 'success': False,
@@ -591,7 +770,7 @@ def approve_user(user_id):
         user.updated_at = datetime.now(timezone.utc)
         db.session.commit()
 
-        logger.info(f"User approved: {user.email}")
+        logger.info("User approved: %s", user.email)
 
         return jsonify({
             'success': True,
@@ -601,7 +780,7 @@ def approve_user(user_id):
 
     except Exception as e:
         db.session.rollback()
-        logger.error(f"Approve user error: {e}")
+        logger.error("Approve user error: %s", e)
         return jsonify({
             'success': False,
             'error': str(e)
@@ -621,7 +800,7 @@ def deny_user(user_id):
         JSON success response
     """
     try:
-        user = User.query.get(user_id)
+        user = db.session.get(User, user_id, populate_existing=True)
         if not user:
             return jsonify({
                 'success': False,
@@ -638,7 +817,7 @@ def deny_user(user_id):
         db.session.delete(user)
         db.session.commit()
 
-        logger.info(f"User request denied and deleted: {email}")
+        logger.info("User request denied and deleted: %s", email)
 
         return jsonify({
             'success': True,
@@ -647,7 +826,7 @@ def deny_user(user_id):
 
     except Exception as e:
         db.session.rollback()
-        logger.error(f"Deny user error: {e}")
+        logger.error("Deny user error: %s", e)
         return jsonify({
             'success': False,
             'error': str(e)
@@ -674,7 +853,7 @@ def update_user(user_id):
         JSON with updated user info
     """
     try:
-        user = User.query.get(user_id)
+        user = db.session.get(User, user_id, populate_existing=True)
         if not user:
             return jsonify({
                 'success': False,
@@ -685,8 +864,7 @@ def update_user(user_id):
 
         # Prevent removing the last admin
         if 'is_admin' in data and not data['is_admin'] and user.is_admin:
-            admin_count = User.query.filter_by(is_admin=True, is_active=True).count()
-            if admin_count <= 1:
+            if not has_other_active_admin(user.id):
                 return jsonify({
                     'success': False,
                     'error': 'Cannot remove the last admin'
@@ -711,7 +889,7 @@ def update_user(user_id):
         user.updated_at = datetime.now(timezone.utc)
         db.session.commit()
 
-        logger.info(f"User updated: {user.email}")
+        logger.info("User updated: %s", user.email)
 
         return jsonify({
             'success': True,
@@ -721,7 +899,7 @@ def update_user(user_id):
 
     except Exception as e:
         db.session.rollback()
-        logger.error(f"Update user error: {e}")
+        logger.error("Update user error: %s", e)
         return jsonify({
             'success': False,
             'error': str(e)
@@ -741,7 +919,7 @@ def delete_user(user_id):
         No content on success
     """
     try:
-        user = User.query.get(user_id)
+        user = db.session.get(User, user_id, populate_existing=True)
         if not user:
             return jsonify({
                 'success': False,
@@ -757,8 +935,7 @@ def delete_user(user_id):
 
         # Prevent deleting the last admin
         if user.is_admin:
-            admin_count = User.query.filter_by(is_admin=True, is_active=True).count()
-            if admin_count <= 1:
+            if not has_other_active_admin(user.id):
                 return jsonify({
                     'success': False,
                     'error': 'Cannot delete the last admin'
@@ -768,13 +945,13 @@ def delete_user(user_id):
         db.session.delete(user)
         db.session.commit()
 
-        logger.info(f"User deleted: {email}")
+        logger.info("User deleted: %s", email)
 
         return '', 204
 
     except Exception as e:
         db.session.rollback()
-        logger.error(f"Delete user error: {e}")
+        logger.error("Delete user error: %s", e)
         return jsonify({
             'success': False,
             'error': str(e)
@@ -794,9 +971,9 @@ def init_admin_user():
         return
 
     # Check if admin already exists
-    existing = User.query.filter_by(email=admin_email.lower()).first()
+    existing = find_user_by_email(admin_email.lower())
     if existing:
-        logger.info(f"Admin user already exists: {admin_email}")
+        logger.info("Admin user already exists: %s", admin_email)
         return
 
     # Create admin user
@@ -812,4 +989,4 @@ def init_admin_user():
     db.session.add(admin)
     db.session.commit()
 
-    logger.info(f"Admin user created: {admin_email}")
+    logger.info("Admin user created: %s", admin_email)
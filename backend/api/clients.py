@@ -10,23 +10,602 @@ Architecture:
 - Connections are created on-demand and cached for reuse
 """
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, g, request, jsonify, stream_with_context
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import MISSING
+from functools import lru_cache
+from threading import Lock
+from weakref import WeakKeyDictionary
 from datetime import datetime, timedelta, timezone
 from easy_acumatica import AcumaticaClient
+from sqlalchemy import delete, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import load_only, raiseload
+import hashlib
+import inspect
+import os
+import re
 import uuid
 import logging
+import orjson
 
-from database import db
-from models import Client, ConnectionLog, ClientMetadataCache, ServiceGroup
+from database import db, is_unique_violation
+from json_provider import dumps_bytes, iter_json_list
+from models import Client, ClientMetadataCache, ServiceGroup
 from encryption import get_encryption_service
 from services.connection_pool import get_connection_pool
+from services.connection_log_writer import connection_log_writer
 from api.auth import require_auth
 
+try:
+    import ormsgpack
+except ImportError:  # Optional; only used when MSGPACK_RESPONSES is enabled
+    ormsgpack = None
+
 logger = logging.getLogger(__name__)
 
 # Create blueprint
 clients_bp = Blueprint('clients', __name__, url_prefix='/api/v1/clients')
 
+# Make unplanned lazy loads raise instead of silently issuing extra queries.
+# Meant for development/staging; off by default so production degrades to
+# the extra query rather than an error.
+STRICT_LOADING = os.getenv('STRICT_LOADING', 'false').lower() == 'true'
+
+# Loader options for endpoints that only return client.to_dict(); skips the
+# encrypted credential columns (and, with STRICT_LOADING, forbids loading
+# them or any relationship later)
+if STRICT_LOADING:
+    _CLIENT_JSON_OPTIONS = [load_only(*Client.json_columns(), raiseload=True), raiseload('*')]
+else:
+    _CLIENT_JSON_OPTIONS = [load_only(*Client.json_columns())]
+
+# Matches the position before every capital letter except the first
+_PASCAL_BOUNDARY_RE = re.compile(r'(?<!^)(?=[A-Z])')
+
+
+@lru_cache(maxsize=1024)
+def service_attr_name(service_name):
+    """
+    Convert a PascalCase service name to its snake_case client attribute.
+
+    Args:
+        service_name: Service name, e.g. 'SalesOrder'
+
+    Returns:
+        Attribute name on AcumaticaClient, e.g. 'sales_order'
+    """
+    return _PASCAL_BOUNDARY_RE.sub('_', service_name).lower().lstrip('_')
+
+
+# Public method names per service class; services of the same class share
+# one entry, and entries go away with the class when a client is rebuilt
+_service_method_names = WeakKeyDictionary()
+
+
+def service_method_names(service):
+    """
+    List the public methods of an Acumatica service object.
+
+    Walks the class hierarchy once per service class instead of calling
+    dir() on every request, then adds any callables set on the instance.
+
+    Args:
+        service: Service object from an AcumaticaClient
+
+    Returns:
+        Sorted list of method names (excluding get_signature)
+    """
+    cls = type(service)
+    names = _service_method_names.get(cls)
+    if names is None:
+        names = frozenset(
+            name
+            for klass in cls.__mro__
+            if klass is not object
+            for name in vars(klass)
+            if not name.startswith('_') and name != 'get_signature'
+            and callable(getattr(cls, name, None))
+        )
+        _service_method_names[cls] = names
+
+    instance_names = {
+        name for name, value in getattr(service, '__dict__', {}).items()
+        if not name.startswith('_') and name != 'get_signature' and callable(value)
+    }
+
+    return sorted(names | instance_names)
+
+
+# One lock per (client, cache key): when an entry expires, only one request
+# per worker rebuilds it from Acumatica while concurrent ones wait for it
+_metadata_refresh_locks = {}
+_metadata_refresh_locks_guard = Lock()
+
+
+def metadata_refresh_lock(client_id, cache_key):
+    """
+    Get the lock serializing refreshes of one metadata cache entry.
+
+    Args:
+        client_id: UUID of the client
+        cache_key: Cache entry key (e.g. 'services_list')
+
+    Returns:
+        threading.Lock for that entry
+    """
+    with _metadata_refresh_locks_guard:
+        return _metadata_refresh_locks.setdefault((client_id, cache_key), Lock())
+
+
+# Matches metadata cache rows that haven't expired. Evaluated by Postgres, so
+# expired rows (and their JSON payloads) are never loaded just to be discarded.
+CACHE_IS_FRESH = or_(ClientMetadataCache.expires_at.is_(None), ClientMetadataCache.expires_at > func.now())
+
+
+def store_metadata_cache(client_id, cache_key, data, ttl_hours=24):
+    """
+    Insert or refresh a metadata cache entry with a single upsert.
+
+    Concurrent refreshes from different workers can't race into a
+    unique-constraint error, and no prior SELECT is needed.
+
+    Args:
+        client_id: UUID of the client
+        cache_key: Cache entry key (e.g. 'services_list')
+        data: JSON-serializable payload
+        ttl_hours: Hours until the entry expires
+
+    Returns:
+        datetime: The entry's cached_at value
+    """
+    now = datetime.now(timezone.utc)
+    stmt = pg_insert(ClientMetadataCache).values(
+        client_id=client_id,
+        cache_key=cache_key,
+        cache_data=data,
+        cached_at=now,
+        expires_at=now + timedelta(hours=ttl_hours)
+    )
+    stmt = stmt.on_conflict_do_update(
+        constraint='unique_client_cache_key',
+        set_={
+            'cache_data': stmt.excluded.cache_data,
+            'cached_at': stmt.excluded.cached_at,
+            'expires_at': stmt.excluded.expires_at,
+        }
+    )
+    db.session.execute(stmt)
+    db.session.commit()
+    return now
+
+
+# Postgres' name for the unique constraint on clients.name (unique=True)
+CLIENT_NAME_CONSTRAINT = 'clients_name_key'
+
+
+# Client settings that determine what a connection sees; changing any of
+# them invalidates the client's cached metadata
+CONNECTION_FIELDS = frozenset({
+    'base_url', 'tenant', 'branch', 'endpoint_name', 'endpoint_version', 'locale'
+})
+
+
+# Parameter lists from inspect.signature, per service class and method name
+_service_method_parameters = WeakKeyDictionary()
+
+
+def describe_parameters(func):
+    """
+    Describe a callable's parameters for the service details response.
+
+    Args:
+        func: Function or method to inspect
+
+    Returns:
+        List of {'name', 'required'[, 'type']} dicts, excluding self
+    """
+    params = []
+    for param_name, param in inspect.signature(func).parameters.items():
+        if param_name != 'self':
+            param_info = {
+                'name': param_name,
+                'required': param.default == inspect.Parameter.empty
+            }
+            if param.annotation != inspect.Parameter.empty:
+                param_info['type'] = str(param.annotation)
+            params.append(param_info)
+    return params
+
+
+def service_method_parameters(service, method_name, method):
+    """
+    Describe a service method's parameters, caching the result per class.
+
+    inspect.signature is slow, and methods defined on a service class have
+    the same signature for every instance, so it runs once per class and
+    method. Methods attached to the instance are inspected every time.
+
+    Args:
+        service: Service object from an AcumaticaClient
+        method_name: Name of the method
+        method: The bound method (used for instance-level callables)
+
+    Returns:
+        List of parameter description dicts
+    """
+    cls = type(service)
+    if method_name in getattr(service, '__dict__', {}):
+        return describe_parameters(method)
+
+    cached = _service_method_parameters.setdefault(cls, {})
+    params = cached.get(method_name)
+    if params is None:
+        params = cached[method_name] = describe_parameters(getattr(cls, method_name))
+    return params
+
+
+@lru_cache(maxsize=4096)
+def _format_type(field_type):
+    return str(field_type)
+
+
+def field_type_name(field_type):
+    """
+    Render a dataclass field annotation as a string.
+
+    Typing generics (Optional[...], List[...]) format recursively in
+    __repr__, and the same annotations recur across fields and models, so
+    the formatted string is memoized per annotation object.
+
+    Args:
+        field_type: Field annotation (type, typing object or string)
+
+    Returns:
+        Annotation as a string, or 'Any' if missing
+    """
+    if not field_type:
+        return 'Any'
+    if isinstance(field_type, str):
+        return field_type
+    try:
+        return _format_type(field_type)
+    except TypeError:
+        # Unhashable annotation
+        return str(field_type)
+
+
+# Optional, more expensive parts of a model description (?include=...):
+# schema from get_schema(), per-field metadata, and the class docstring
+MODEL_INCLUDE_OPTIONS = frozenset({'schema', 'metadata', 'doc'})
+
+
+def parse_model_include(raw):
+    """
+    Parse an include list for model details.
+
+    Args:
+        raw: Comma-separated string or list of names, or None
+
+    Returns:
+        frozenset of requested parts; everything when raw is None so
+        existing callers keep the full description
+    """
+    if raw is None:
+        return MODEL_INCLUDE_OPTIONS
+    if isinstance(raw, str):
+        raw = raw.split(',')
+    return frozenset(part.strip() for part in raw if isinstance(part, str)) & MODEL_INCLUDE_OPTIONS
+
+
+# Encoded model details and their ETag per generated model class, one entry
+# per include set. Model classes belong to one AcumaticaClient, so a rebuilt
+# client gets fresh entries and the old ones are dropped with the old classes.
+_model_descriptions = WeakKeyDictionary()
+
+
+def describe_model(model_class, model_name, include=MODEL_INCLUDE_OPTIONS):
+    """
+    Introspect a model class once per include set and cache the encoding.
+
+    Parts that weren't requested are neither computed nor returned.
+
+    Args:
+        model_class: Dataclass model from acumatica_client.models
+        model_name: Model name as requested
+        include: Parts from MODEL_INCLUDE_OPTIONS to include
+
+    Returns:
+        Tuple of (JSON object bytes with name, fields, field_count and the
+        requested parts, ETag for those bytes)
+    """
+    variants = _model_descriptions.get(model_class)
+    if variants is None:
+        variants = _model_descriptions[model_class] = {}
+    cached = variants.get(include)
+    if cached is not None:
+        return cached
+
+    with_metadata = 'metadata' in include
+
+    # Get model fields (for backward compatibility), in a single pass with
+    # the loop invariants held in locals
+    fields = []
+    dataclass_fields = getattr(model_class, '__dataclass_fields__', None)
+    if dataclass_fields:
+        append = fields.append
+        missing = MISSING
+        type_name = field_type_name
+        for field_name, field_obj in dataclass_fields.items():
+            field_info = {
+                'name': field_name,
+                'type': type_name(field_obj.type),
+                # Dataclasses mark "no default" with MISSING, not None
+                'required': field_obj.default is missing and field_obj.default_factory is missing
+            }
+
+            # Add metadata if available (dataclass fields always have .metadata;
+            # most are empty, so the common case skips this block)
+            if with_metadata:
+                metadata = field_obj.metadata
+                if metadata:
+                    description = metadata.get('description')
+                    if description is not None:
+                        field_info['description'] = description
+                    max_length = metadata.get('max_length')
+                    if max_length is not None:
+                        field_info['max_length'] = max_length
+
+            append(field_info)
+
+    model = {
+        'name': model_name,
+        'fields': fields,
+        'field_count': len(fields),
+    }
+
+    if 'schema' in include:
+        # Try to get schema using the new get_schema method from easy-acumatica 0.5.5.
+        # The outcome (including "no schema") is cached with the rest of the
+        # description, so models without get_schema are only probed once.
+        schema = None
+        get_schema = getattr(model_class, 'get_schema', None)
+        if get_schema is not None:
+            try:
+                schema = get_schema()
+            except Exception as e:
+                logger.warning("Could not get schema for model %s: %s", model_name, e)
+        model['schema'] = schema  # New schema from get_schema()
+
+    if 'doc' in include:
+        model['description'] = model_class.__doc__ if hasattr(model_class, '__doc__') and model_class.__doc__ else None
+
+    encoded = dumps_bytes(model)
+
+    cached = (encoded, hashlib.blake2b(encoded, digest_size=16).hexdigest())
+    variants[include] = cached
+    return cached
+
+
+# Static error bodies for the model endpoints, encoded once at import
+_CLIENT_NOT_FOUND_BODY = dumps_bytes({'success': False, 'error': 'Client not found'})
+_CLIENT_INACTIVE_BODY = dumps_bytes({'success': False, 'error': 'Client is inactive. Please activate it first.'})
+_MODELS_UNAVAILABLE_BODY = dumps_bytes({'success': False, 'error': 'Models not available'})
+
+
+def json_error(body, status):
+    """Wrap a pre-encoded JSON error body in a response."""
+    return Response(body, status=status, mimetype='application/json')
+
+
+# Leading bytes of every successful per-client metadata response
+_CLIENT_ENVELOPE_PREFIX = b'{"success":true,"client_id":'
+
+
+def client_envelope(client_id, *fields):
+    """
+    Build {"success": true, "client_id": ..., <fields>} from encoded parts.
+
+    Lets handlers splice cached or freshly encoded payloads into the shared
+    envelope without building and re-encoding an outer dict.
+
+    Args:
+        client_id: UUID of the client
+        *fields: (name, encoded JSON value) pairs, both bytes
+
+    Returns:
+        200 JSON response
+    """
+    body = [_CLIENT_ENVELOPE_PREFIX, dumps_bytes(str(client_id))]
+    for name, value in fields:
+        body += (b',"', name, b'":', value)
+    body.append(b'}')
+    return Response(b''.join(body), status=200, mimetype='application/json')
+
+
+# Encoded models list per client: client_id -> (cached_at, models JSON, total).
+# Entries are only used while their cached_at matches the database row, so
+# a refresh from any worker invalidates them.
+_models_list_memo = {}
+
+
+def encode_models_list(client_id, cached_at, field_counts):
+    """
+    Encode a {name: field_count} map as the models list and memoize it.
+
+    Args:
+        client_id: UUID of the client
+        cached_at: cached_at of the metadata cache row the counts came from
+        field_counts: Dict mapping model name to field count
+
+    Returns:
+        Tuple of (encoded models list, total)
+    """
+    encoded = dumps_bytes([
+        {'name': name, 'field_count': count}
+        for name, count in field_counts.items()
+    ])
+    _models_list_memo[client_id] = (cached_at, encoded, len(field_counts))
+    return encoded, len(field_counts)
+
+
+def forget_client_metadata(client_id):
+    """
+    Drop this worker's memoized models list and refresh locks for a client.
+
+    Called when the client is deleted or its connection changes, so the
+    per-client entries don't outlive the cache rows they belong to.
+
+    Args:
+        client_id: UUID of the client
+    """
+    _models_list_memo.pop(client_id, None)
+    with _metadata_refresh_locks_guard:
+        for key in [key for key in _metadata_refresh_locks if key[0] == client_id]:
+            del _metadata_refresh_locks[key]
+
+
+# Model name -> model class per pooled AcumaticaClient
+_model_registries = WeakKeyDictionary()
+
+
+def lookup_model(acumatica_client, model_name):
+    """
+    Resolve a model class by name through a per-connection registry.
+
+    The registry is seeded from the models namespace once per connection so
+    lookups are plain dict hits. Names missing from it (e.g. models the
+    library creates lazily) fall back to getattr and are remembered.
+
+    Args:
+        acumatica_client: Connected AcumaticaClient
+        model_name: Model name as requested
+
+    Returns:
+        Model class, or None if the model doesn't exist
+
+    Raises:
+        LookupError: If the client exposes no models at all
+    """
+    registry = _model_registries.get(acumatica_client)
+    if registry is None:
+        models = getattr(acumatica_client, 'models', None)
+        if models is None:
+            raise LookupError('Models not available')
+        registry = {
+            name: value for name, value in getattr(models, '__dict__', {}).items()
+            if not name.startswith('_')
+        }
+        _model_registries[acumatica_client] = registry
+
+    model_class = registry.get(model_name)
+    if model_class is None and not model_name.startswith('_'):
+        model_class = getattr(acumatica_client.models, model_name, None)
+        if model_class is not None:
+            registry[model_name] = model_class
+    return model_class
+
+
+# Serve model details as MessagePack to clients that ask for it with
+# Accept: application/msgpack (requires the ormsgpack package)
+MSGPACK_RESPONSES = os.getenv('MSGPACK_RESPONSES', 'false').lower() == 'true' and ormsgpack is not None
+
+MSGPACK_MIMETYPE = 'application/msgpack'
+
+# MessagePack-encoded model details per model class and include set, derived
+# from the JSON cached by describe_model()
+_model_msgpack = WeakKeyDictionary()
+
+
+def wants_msgpack():
+    """Whether this request should get a MessagePack body instead of JSON."""
+    return MSGPACK_RESPONSES and request.accept_mimetypes.best_match(
+        ['application/json', MSGPACK_MIMETYPE]
+    ) == MSGPACK_MIMETYPE
+
+
+def model_msgpack_response(client_id, model_class, model_json, include):
+    """
+    Build the model details response as MessagePack.
+
+    The model map is encoded once per class; the envelope is a 3-entry map
+    header followed by the packed keys/values, with the cached model
+    spliced in as the last value.
+
+    Args:
+        client_id: UUID of the client
+        model_class: Model class the JSON was generated from
+        model_json: Cached JSON bytes from describe_model()
+        include: Include set model_json was built with
+
+    Returns:
+        200 MessagePack response
+    """
+    variants = _model_msgpack.get(model_class)
+    if variants is None:
+        variants = _model_msgpack[model_class] = {}
+    model_packed = variants.get(include)
+    if model_packed is None:
+        model_packed = variants[include] = ormsgpack.packb(orjson.loads(model_json))
+
+    body = b''.join((
+        b'\x83',
+        ormsgpack.packb('success'), ormsgpack.packb(True),
+        ormsgpack.packb('client_id'), ormsgpack.packb(str(client_id)),
+        ormsgpack.packb('model'), model_packed
+    ))
+    return Response(body, status=200, mimetype=MSGPACK_MIMETYPE)
+
+
+# Upper bound on concurrent Acumatica metadata lookups per request
+METADATA_FETCH_WORKERS = 16
+
+
+def fetch_metadata(get_info, names, key):
+    """
+    Look up metadata for many services/models concurrently.
+
+    Each lookup is an independent blocking call, so running them on a bounded
+    thread pool turns N sequential round-trips into roughly N / workers.
+
+    Args:
+        get_info: Callable taking a name and returning an info dict
+        names: Service or model names, in the order they should be returned
+        key: Key to extract from each info dict ('methods' or 'fields')
+
+    Returns:
+        Dict mapping each name to its extracted metadata ({} if the lookup failed)
+    """
+    def fetch(name):
+        try:
+            return get_info(name).get(key, {})
+        except Exception:
+            # If we can't get info, just add the name
+            return {}
+
+    names = list(names)
+    if not names:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=min(METADATA_FETCH_WORKERS, len(names))) as executor:
+        return dict(zip(names, executor.map(fetch, names)))
+
+
+@clients_bp.after_request
+def add_conditional_caching(response):
+    """
+    Let the browser revalidate GET responses with If-None-Match.
+
+    'no-cache' forces revalidation on every request so data is never stale
+    across workers; when the body is unchanged the reply becomes a bodiless 304.
+    """
+    if request.method == 'GET' and response.status_code == 200 and not response.is_streamed:
+        response.headers['Cache-Control'] = 'private, no-cache'
+        response.add_etag()
+        response.make_conditional(request)
+    return response
+
 
 def get_client_connection(client_id):
     """
@@ -42,22 +621,31 @@ def get_client_connection(client_id):
     Raises:
         Exception if connection fails
     """
-    pool = get_connection_pool()
-    return pool.get_connection(str(client_id))
-
-
-def disconnect_client(client_id):
+    # Reuse the connection already resolved during this request, skipping
+    # the pool's per-client lock and expiry bookkeeping
+    connections = g.setdefault('_acumatica_connections', {})
+    key = str(client_id)
+    acumatica_client = connections.get(key)
+    if acumatica_client is None:
+        pool = get_connection_pool()
+        acumatica_client = connections[key] = pool.get_connection(key)
+    return acumatica_client
+
+
+def disconnect_client(client_id, wait=False):
     """
     Disconnect a client from the pool.
 
     Args:
         client_id: UUID of the client
+        wait: Wait for the Acumatica logout instead of running it in the background
 
     Returns:
         True if disconnected, False if not in pool
     """
+    g.get('_acumatica_connections', {}).pop(str(client_id), None)
     pool = get_connection_pool()
-    return pool.disconnect(str(client_id))
+    return pool.disconnect(str(client_id), wait=wait)
 
 
 @clients_bp.route('', methods=['GET'])
@@ -74,18 +662,20 @@ def list_clients():
         JSON response with list of clients
     """
     try:
-        # Start query
-        query = Client.query
+        # Select only the serialized columns (skips ORM hydration and the
+        # encrypted credential blobs)
+        stmt = select(*Client.json_columns())
 
         # Apply filters
         active = request.args.get('active')
         if active is not None:
-            query = query.filter_by(is_active=(active.lower() == 'true'))
+            stmt = stmt.where(Client.is_active == (active.lower() == 'true'))
 
         search = request.args.get('search')
         if search:
+            # Served by the pg_trgm GIN indexes (see database.INDEX_DDL)
             search_pattern = f'%{search}%'
-            query = query.filter(
+            stmt = stmt.where(
                 db.or_(
                     Client.name.ilike(search_pattern),
                     Client.description.ilike(search_pattern)
@@ -93,19 +683,18 @@ def list_clients():
             )
 
         # Order by created date (newest first)
-        query = query.order_by(Client.created_at.desc())
-
-        # Execute query
-        clients = query.all()
+        stmt = stmt.order_by(Client.created_at.desc())
+
+        # Stream rows in batches of 100 and encode them as they arrive, so
+        # memory stays flat however many clients match
+        rows = db.session.execute(stmt.execution_options(yield_per=100))
+        body = iter_json_list(
+            {'success': True},
+            'clients',
+            (Client.serialize(row) for row in rows)
+        )
 
-        # Convert to dictionary
-        clients_data = [client.to_dict() for client in clients]
-
-        return jsonify({
-            'success': True,
-            'clients': clients_data,
-            'total': len(clients_data)
-        }), 200
+        return Response(stream_with_context(body), status=200, mimetype='application/json')
 
     except Exception as e:
         return jsonify({
@@ -138,14 +727,6 @@ def create_client():
                     'error': f'Missing required field: {field}'
                 }), 400
 
-        # Check if name already exists
-        existing = Client.query.filter_by(name=data['name']).first()
-        if existing:
-            return jsonify({
-                'success': False,
-                'error': f'Client with name "{data["name"]}" already exists'
-            }), 409
-
         # Encrypt credentials
         encryption = get_encryption_service()
         encrypted_username = encryption.encrypt(data['username'])
@@ -173,11 +754,24 @@ def create_client():
             is_active=data.get('is_active', True)
         )
 
-        # Save to database
+        # Flush to assign client.id, then save the client and its default
+        # service group in a single transaction. The unique constraint on
+        # name rejects duplicates here, so no separate lookup is needed.
         db.session.add(client)
-        db.session.commit()
+        try:
+            db.session.flush()
+        except IntegrityError as e:
+            db.session.rollback()
+            if is_unique_violation(e, CLIENT_NAME_CONSTRAINT):
+                return jsonify({
+                    'success': False,
+                    'error': f'Client with name "{data["name"]}" already exists'
+                }), 409
+            return jsonify({
+                'success': False,
+                'error': f'Invalid client data: {e.orig}'
+            }), 400
 
-        # Create default service group for the client
         default_service_group = ServiceGroup(
             client_id=client.id,
             name='default',
@@ -188,7 +782,7 @@ def create_client():
         db.session.add(default_service_group)
         db.session.commit()
 
-        logger.info(f"Created client {client.id} with default service group")
+        logger.info("Created client %s with default service group", client.id)
 
         # Show full API key only on creation
         return jsonify({
@@ -218,7 +812,7 @@ def get_client(client_id):
         JSON response with client details (without credentials)
     """
     try:
-        client = Client.query.get(client_id)
+        client = db.session.get(Client, client_id, options=_CLIENT_JSON_OPTIONS)
         if not client:
             return jsonify({
                 'success': False,
@@ -253,7 +847,7 @@ def update_client(client_id):
         JSON response with updated client
     """
     try:
-        client = Client.query.get(client_id)
+        client = db.session.get(Client, client_id)
         if not client:
             return jsonify({
                 'success': False,
@@ -271,8 +865,11 @@ def update_client(client_id):
             'cache_methods', 'cache_ttl_hours', 'is_active'
         ]
 
+        connection_changed = False
         for field in updatable_fields:
             if field in data:
+                if field in CONNECTION_FIELDS and data[field] != getattr(client, field):
+                    connection_changed = True
                 setattr(client, field, data[field])
 
         # Handle credential updates separately (need encryption)
@@ -288,15 +885,33 @@ def update_client(client_id):
         # Update timestamp
         client.updated_at = datetime.now(timezone.utc)
 
-        # If credentials changed, disconnect from pool to force reconnect with new credentials
-        if credentials_changed:
+        # If credentials or connection settings changed, disconnect from pool to
+        # force a reconnect, and drop cached metadata in the same commit: a
+        # different instance, tenant or endpoint exposes different services and models
+        if connection_changed or credentials_changed:
             disconnect_client(client_id)
+            ClientMetadataCache.query.filter_by(client_id=client_id).delete()
+            forget_client_metadata(client_id)
 
         # If client is being deactivated, disconnect from pool
         if 'is_active' in data and not data['is_active']:
             disconnect_client(client_id)
 
-        db.session.commit()
+        # Name uniqueness is enforced by the unique constraint; other integrity
+        # errors (e.g. null for a required field) are bad input
+        try:
+            db.session.commit()
+        except IntegrityError as e:
+            db.session.rollback()
+            if is_unique_violation(e, CLIENT_NAME_CONSTRAINT):
+                return jsonify({
+                    'success': False,
+                    'error': f'Client with name "{data.get("name")}" already exists'
+                }), 409
+            return jsonify({
+                'success': False,
+                'error': f'Invalid client data: {e.orig}'
+            }), 400
 
         return jsonify({
             'success': True,
@@ -324,7 +939,7 @@ def delete_client(client_id):
         No content on success
     """
     try:
-        client = Client.query.get(client_id)
+        client = db.session.get(Client, client_id)
         if not client:
             return jsonify({
                 'success': False,
@@ -337,6 +952,7 @@ def delete_client(client_id):
         # Delete from database (cascade will handle related records)
         db.session.delete(client)
         db.session.commit()
+        forget_client_metadata(client_id)
 
         return '', 204
 
@@ -367,7 +983,9 @@ def connect_to_client(client_id):
         JSON response with connection status
     """
     try:
-        client = Client.query.get(client_id)
+        # Load the full row: on a cold connect the pool reads the credentials and
+        # connection settings from this same instance in the identity map
+        client = db.session.get(Client, client_id)
         if not client:
             return jsonify({
                 'success': False,
@@ -381,7 +999,7 @@ def connect_to_client(client_id):
                 'error': 'This client is currently inactive. Please activate it before connecting.'
             }), 403
 
-        logger.info(f"Connecting to client {client_id}: base_url={client.base_url}, tenant={client.tenant}")
+        logger.info("Connecting to client %s: base_url=%s, tenant=%s", client_id, client.base_url, client.tenant)
 
         # Try to get/create connection via pool
         try:
@@ -391,16 +1009,14 @@ def connect_to_client(client_id):
             client.last_connected_at = datetime.now(timezone.utc)
             db.session.commit()
 
-            # Log successful connection
-            log = ConnectionLog(
+            # Log the connection (written in the background)
+            connection_log_writer.enqueue(
                 client_id=client_id,
                 event_type='connect',
                 success=True,
                 user_agent=request.headers.get('User-Agent'),
                 ip_address=request.remote_addr
             )
-            db.session.add(log)
-            db.session.commit()
 
             return jsonify({
                 'success': True,
@@ -415,7 +1031,7 @@ def connect_to_client(client_id):
 
         except Exception as login_error:
             # Log failed connection
-            log = ConnectionLog(
+            connection_log_writer.enqueue(
                 client_id=client_id,
                 event_type='connect',
                 success=False,
@@ -423,8 +1039,6 @@ def connect_to_client(client_id):
                 user_agent=request.headers.get('User-Agent'),
                 ip_address=request.remote_addr
             )
-            db.session.add(log)
-            db.session.commit()
 
             return jsonify({
                 'success': False,
@@ -447,23 +1061,25 @@ def disconnect_from_client(client_id):
     Args:
         client_id: UUID of the client
 
+    Query Parameters:
+        - wait: Wait for the Acumatica logout to finish (true/false, default false)
+
     Returns:
         JSON response confirming disconnection
     """
     try:
-        # Remove from pool
-        was_connected = disconnect_client(client_id)
+        # Remove from pool (logout runs in the background unless ?wait=true)
+        wait = request.args.get('wait', '').lower() in ('1', 'true')
+        was_connected = disconnect_client(client_id, wait=wait)
 
         # Log disconnection
-        log = ConnectionLog(
+        connection_log_writer.enqueue(
             client_id=client_id,
             event_type='disconnect',
             success=True,
             user_agent=request.headers.get('User-Agent'),
             ip_address=request.remote_addr
         )
-        db.session.add(log)
-        db.session.commit()
 
         return jsonify({
             'success': True,
@@ -496,7 +1112,7 @@ def rebuild_client(client_id):
     """
     try:
         # Get the client from database
-        client = Client.query.get(client_id)
+        client = db.session.get(Client, client_id)
         if not client:
             return jsonify({
                 'success': False,
@@ -506,29 +1122,34 @@ def rebuild_client(client_id):
         # Step 1: Disconnect from pool
         was_connected = disconnect_client(client_id)
 
-        # Step 2: Clear cached metadata (this invalidates the cache)
-        ClientMetadataCache.query.filter_by(client_id=client_id).delete()
-        db.session.commit()
+        # Step 2: Clear cached metadata (this invalidates the cache). The DELETE
+        # runs after the slow login so its row locks don't block other workers'
+        # cache writes while waiting on Acumatica
+        clear_cache = delete(ClientMetadataCache).where(ClientMetadataCache.client_id == client_id)
 
         # Step 3: Reconnect if client is active
         if client.is_active:
-            pool = get_connection_pool()
-            pool.refresh_connection(str(client_id))
-
-            # Update last connected timestamp
+            try:
+                get_connection_pool().get_connection(str(client_id))
+            except Exception:
+                # Still drop the stale metadata when the reconnect fails
+                if db.session.execute(clear_cache).rowcount:
+                    db.session.commit()
+                raise
+
+            # Clear the cache and update last connected timestamp in one commit
+            db.session.execute(clear_cache)
             client.last_connected_at = datetime.now(timezone.utc)
             db.session.commit()
 
-            # Log the rebuild
-            log = ConnectionLog(
+            # Log the rebuild (written in the background)
+            connection_log_writer.enqueue(
                 client_id=client_id,
                 event_type='rebuild',
                 success=True,
                 user_agent=request.headers.get('User-Agent'),
                 ip_address=request.remote_addr
             )
-            db.session.add(log)
-            db.session.commit()
 
             return jsonify({
                 'success': True,
@@ -536,6 +1157,10 @@ def rebuild_client(client_id):
                 'was_connected': was_connected
             }), 200
         else:
+            # Nothing to commit when there was no cache to clear
+            if db.session.execute(clear_cache).rowcount:
+                db.session.commit()
+
             return jsonify({
                 'success': True,
                 'message': 'Client cache cleared (client is inactive)',
@@ -562,22 +1187,27 @@ def activate_client(client_id):
         JSON response confirming activation
     """
     try:
-        client = Client.query.get(client_id)
-        if not client:
+        # Set client as active and read it back in the same statement
+        row = db.session.execute(
+            update(Client)
+            .where(Client.id == client_id)
+            .values(is_active=True, updated_at=datetime.now(timezone.utc))
+            .returning(*Client.json_columns())
+            .execution_options(synchronize_session=False)
+        ).one_or_none()
+        if row is None:
+            db.session.rollback()
             return jsonify({
                 'success': False,
                 'error': 'Client not found'
             }), 404
 
-        # Set client as active
-        client.is_active = True
-        client.updated_at = datetime.now(timezone.utc)
         db.session.commit()
 
         return jsonify({
             'success': True,
             'message': 'Client activated successfully',
-            'client': client.to_dict()
+            'client': Client.serialize(row)
         }), 200
 
     except Exception as e:
@@ -601,25 +1231,30 @@ def deactivate_client(client_id):
         JSON response confirming deactivation
     """
     try:
-        client = Client.query.get(client_id)
-        if not client:
+        # Set client as inactive and read it back in the same statement
+        row = db.session.execute(
+            update(Client)
+            .where(Client.id == client_id)
+            .values(is_active=False, updated_at=datetime.now(timezone.utc))
+            .returning(*Client.json_columns())
+            .execution_options(synchronize_session=False)
+        ).one_or_none()
+        if row is None:
+            db.session.rollback()
             return jsonify({
                 'success': False,
                 'error': 'Client not found'
             }), 404
 
+        db.session.commit()
+
         # Disconnect from pool
         was_connected = disconnect_client(client_id)
 
-        # Set client as inactive
-        client.is_active = False
-        client.updated_at = datetime.now(timezone.utc)
-        db.session.commit()
-
         return jsonify({
             'success': True,
             'message': 'Client deactivated successfully',
-            'client': client.to_dict(),
+            'client': Client.serialize(row),
             'was_connected': was_connected
         }), 200
 
@@ -644,7 +1279,7 @@ def get_api_key(client_id):
         JSON response with the full API key
     """
     try:
-        client = Client.query.get(client_id)
+        client = db.session.get(Client, client_id)
         if not client:
             return jsonify({
                 'success': False,
@@ -679,22 +1314,27 @@ def regenerate_api_key(client_id):
         JSON response with the new API key (shown in full, only time)
     """
     try:
-        client = Client.query.get(client_id)
-        if not client:
+        # Generate new API key
+        api_key = db.session.execute(
+            update(Client)
+            .where(Client.id == client_id)
+            .values(api_key=uuid.uuid4(), updated_at=datetime.now(timezone.utc))
+            .returning(Client.api_key)
+            .execution_options(synchronize_session=False)
+        ).scalar_one_or_none()
+        if api_key is None:
+            db.session.rollback()
             return jsonify({
                 'success': False,
                 'error': 'Client not found'
             }), 404
 
-        # Generate new API key
-        client.api_key = uuid.uuid4()
-        client.updated_at = datetime.now(timezone.utc)
         db.session.commit()
 
         return jsonify({
             'success': True,
             'message': 'API key regenerated successfully',
-            'api_key': str(client.api_key),  # Show full key only on regeneration
+            'api_key': str(api_key),  # Show full key only on regeneration
             'warning': 'The old API key has been invalidated. Update all external services with the new key.'
         }), 200
 
@@ -724,7 +1364,7 @@ def list_client_services(client_id):
     """
     try:
         # Get client from database first to validate it exists
-        client = Client.query.get(client_id)
+        client = db.session.get(Client, client_id)
         if not client:
             return jsonify({
                 'success': False,
@@ -742,50 +1382,39 @@ def list_client_services(client_id):
 
         # Check cache first
         cache_key = 'services_list'
-        cache = ClientMetadataCache.query.filter_by(
+        fresh_cache = ClientMetadataCache.query.filter_by(
             client_id=client_id,
             cache_key=cache_key
-        ).first()
+        ).filter(CACHE_IS_FRESH)
+        cache = fresh_cache.first()
+
+        if not cache:
+            with metadata_refresh_lock(client_id, cache_key):
+                # Another request may have refreshed the cache while this one waited
+                cache = fresh_cache.first()
+
+                if not cache:
+                    # Get services from Acumatica (returns list of service names)
+                    service_names = acumatica_client.list_services()
 
-        if cache and not cache.is_expired():
+                    # Build services dict with basic info
+                    services = fetch_metadata(acumatica_client.get_service_info, service_names, 'methods')
+
+                    # Update cache
+                    store_metadata_cache(client_id, cache_key, services, client.cache_ttl_hours or 24)
+
+        if cache:
             services = cache.cache_data
-        else:
-            # Get services from Acumatica (returns list of service names)
-            service_names = acumatica_client.list_services()
-
-            # Build services dict with basic info
-            services = {}
-            for name in service_names:
-                try:
-                    info = acumatica_client.get_service_info(name)
-                    services[name] = info.get('methods', {})
-                except Exception as e:
-                    # If we can't get info, just add the name
-                    services[name] = {}
-
-            # Update cache
-            if cache:
-                cache.cache_data = services
-                cache.cached_at = datetime.now(timezone.utc)
-                cache.expires_at = datetime.now(timezone.utc) + timedelta(hours=24)
-            else:
-                cache = ClientMetadataCache(
-                    client_id=client_id,
-                    cache_key=cache_key,
-                    cache_data=services,
-                    expires_at=datetime.now(timezone.utc) + timedelta(hours=24)
-                )
-                db.session.add(cache)
-            db.session.commit()
 
-        # Format response
-        services_list = []
-        for name, methods in services.items():
-            services_list.append({
+        # Format response (method names are materialized once per service)
+        services_list = [
+            {
                 'name': name,
-                'methods': list(methods.keys()) if isinstance(methods, dict) else methods,
-                'method_count': len(methods) if methods else 0
-            })
+                'methods': (method_names := list(methods) if isinstance(methods, dict) else methods),
+                'method_count': len(method_names) if method_names else 0
+            }
+            for name, methods in services.items()
+        ]
 
         return jsonify({
             'success': True,
@@ -815,11 +1444,9 @@ def get_client_service_details(client_id, service_name):
     Returns:
         JSON response with service details
     """
-    import inspect
-
     try:
         # Get client from database first to validate it exists
-        client = Client.query.get(client_id)
+        client = db.session.get(Client, client_id)
         if not client:
             return jsonify({
                 'success': False,
@@ -832,81 +1459,95 @@ def get_client_service_details(client_id, service_name):
                 'error': 'Client is inactive. Please activate it first.'
             }), 400
 
+        # Check cache first; cleared by rebuild_client like the service list
+        cache_key = f'service_details:{service_name}'
+        cache = ClientMetadataCache.query.filter_by(
+            client_id=client_id,
+            cache_key=cache_key
+        ).filter(CACHE_IS_FRESH).first()
+
+        if cache:
+            return jsonify({
+                'success': True,
+                'client_id': str(client_id),
+                'service': cache.cache_data
+            }), 200
+
         # Get connection from pool (creates if needed)
         acumatica_client = get_client_connection(client_id)
 
         # Get the service object directly
         # Convert PascalCase service name to snake_case (no pluralization in 0.5.6+)
-        service_attr_name = ''.join(['_' + i.lower() if i.isupper() else i for i in service_name]).lstrip('_')
+        attr_name = service_attr_name(service_name)
 
         try:
-            service = getattr(acumatica_client, service_attr_name)
+            service = getattr(acumatica_client, attr_name)
         except AttributeError:
             return jsonify({
                 'success': False,
-                'error': f'Service {service_name} not found (tried attribute: {service_attr_name})'
+                'error': f'Service {service_name} not found (tried attribute: {attr_name})'
             }), 404
 
         # Get service methods with signatures using new get_signature method
+        # (available from easy-acumatica 0.5.5; looked up once, not per method)
+        get_signature = getattr(service, 'get_signature', None)
+
         methods = []
-        for method_name in dir(service):
-            if not method_name.startswith('_') and method_name != 'get_signature':
-                try:
-                    method = getattr(service, method_name)
-                    if callable(method):
-                        # Try using the new get_signature method from easy-acumatica 0.5.5
-                        signature_str = None
+        for method_name in service_method_names(service):
+            try:
+                method = getattr(service, method_name)
+                if callable(method):
+                    # Try using the new get_signature method from easy-acumatica 0.5.5
+                    signature_str = None
+                    try:
+                        if get_signature is not None:
+                            signature_str = get_signature(method_name)
+                            logger.debug("Got signature for %s: %s", method_name, signature_str)
+                    except (ValueError, AttributeError) as e:
+                        # Method doesn't have a signature in the registry
+                        logger.debug("No signature for %s: %s", method_name, e)
+                        pass
+
+                    # Build method info
+                    method_info = {
+                        'name': method_name,
+                        'signature': signature_str,
+                        'docstring': method.__doc__ if method.__doc__ else None
+                    }
+
+                    # If we don't have a signature string, try inspect as fallback
+                    if not signature_str:
                         try:
-                            if hasattr(service, 'get_signature'):
-                                signature_str = service.get_signature(method_name)
-                                logger.info(f"Got signature for {method_name}: {signature_str} (type: {type(signature_str)})")
-                        except (ValueError, AttributeError) as e:
-                            # Method doesn't have a signature in the registry
-                            logger.debug(f"No signature for {method_name}: {e}")
-                            pass
-
-                        # Build method info
-                        method_info = {
-                            'name': method_name,
-                            'signature': signature_str,
-                            'docstring': method.__doc__ if method.__doc__ else None
-                        }
-
-                        # If we don't have a signature string, try inspect as fallback
-                        if not signature_str:
-                            try:
-                                sig = inspect.signature(method)
-                                params = []
-                                for param_name, param in sig.parameters.items():
-                                    if param_name != 'self':
-                                        param_info = {
-                                            'name': param_name,
-                                            'required': param.default == inspect.Parameter.empty
-                                        }
-                                        if param.annotation != inspect.Parameter.empty:
-                                            param_info['type'] = str(param.annotation)
-                                        params.append(param_info)
-                                method_info['parameters'] = params
-                            except:
-                                method_info['parameters'] = []
-
-                        methods.append(method_info)
-                except:
-                    pass
+                            method_info['parameters'] = service_method_parameters(service, method_name, method)
+                        except:
+                            method_info['parameters'] = []
+
+                    methods.append(method_info)
+            except:
+                pass
+
+        service_data = {
+            'name': service_name,
+            'methods': methods,
+            'total_methods': len(methods),
+            'url': f"/entity/{service_name}" if hasattr(service, 'get_entity') else None
+        }
+
+        # Update cache (a failed write only costs the next request a rebuild)
+        try:
+            store_metadata_cache(client_id, cache_key, service_data, client.cache_ttl_hours or 24)
+        except Exception as e:
+            db.session.rollback()
+            logger.warning("Failed to cache service details for %s: %s", service_name, e)
 
         return jsonify({
             'success': True,
             'client_id': str(client_id),
-            'service': {
-                'name': service_name,
-                'methods': methods,
-                'total_methods': len(methods),
-                'url': f"/entity/{service_name}" if hasattr(service, 'get_entity') else None
-            }
+            'service': service_data
         }), 200
 
     except Exception as e:
-        logger.error(f"Failed to get service details: {e}")
+        logger.error("Failed to get service details: %s", e)
         return jsonify({
             'success': False,
             'error': str(e)
@@ -931,74 +1572,69 @@ def list_client_models(client_id):
     """
     try:
         # Get client from database first to validate it exists
-        client = Client.query.get(client_id)
-        if not client:
-            return jsonify({
-                'success': False,
-                'error': 'Client not found'
-            }), 404
+        client = db.session.execute(
+            select(Client.is_active, Client.cache_ttl_hours).where(Client.id == client_id)
+        ).first()
+        if client is None:
+            return json_error(_CLIENT_NOT_FOUND_BODY, 404)
 
         if not client.is_active:
-            return jsonify({
-                'success': False,
-                'error': 'Client is inactive. Please activate it first.'
-            }), 400
+            return json_error(_CLIENT_INACTIVE_BODY, 400)
 
         # Get connection from pool (creates if needed)
         acumatica_client = get_client_connection(client_id)
 
-        # Check cache first
-        cache_key = 'models_list'
-        cache = ClientMetadataCache.query.filter_by(
-            client_id=client_id,
-            cache_key=cache_key
-        ).first()
+        # Check cache first. Only field counts are cached ({name: count});
+        # the listing never needs the field definitions themselves. Read the
+        # timestamp of a fresh row first: if this worker already encoded this exact
+        # cache row, the JSON column doesn't need to be loaded at all.
+        cache_key = 'model_field_counts'
+        cache_filter = (
+            ClientMetadataCache.client_id == client_id,
+            ClientMetadataCache.cache_key == cache_key,
+            CACHE_IS_FRESH
+        )
+        cached_at = db.session.scalar(select(ClientMetadataCache.cached_at).where(*cache_filter))
+        models_json = None
 
-        if cache and not cache.is_expired():
-            models = cache.cache_data
-        else:
-            # Get models from Acumatica (returns list of model names)
-            model_names = acumatica_client.list_models()
-
-            # Build models dict with basic info
-            models = {}
-            for name in model_names:
-                try:
-                    info = acumatica_client.get_model_info(name)
-                    models[name] = info.get('fields', {})
-                except Exception as e:
-                    # If we can't get info, just add the name
-                    models[name] = {}
-
-            # Update cache
-            if cache:
-                cache.cache_data = models
-                cache.cached_at = datetime.now(timezone.utc)
-                cache.expires_at = datetime.now(timezone.utc) + timedelta(hours=24)
+        if cached_at:
+            memo = _models_list_memo.get(client_id)
+            if memo and memo[0] == cached_at:
+                _, models_json, total = memo
             else:
-                cache = ClientMetadataCache(
-                    client_id=client_id,
-                    cache_key=cache_key,
-                    cache_data=models,
-                    expires_at=datetime.now(timezone.utc) + timedelta(hours=24)
-                )
-                db.session.add(cache)
-            db.session.commit()
-
-        # Format response
-        models_list = []
-        for name, fields in models.items():
-            models_list.append({
-                'name': name,
-                'field_count': len(fields) if fields else 0
-            })
-
-        return jsonify({
-            'success': True,
-            'client_id': str(client_id),
-            'models': models_list,
-            'total': len(models_list)
-        }), 200
+                # The row may have expired or been cleared since the timestamp
+                # read; that falls through to a refresh below
+                field_counts = db.session.scalar(select(ClientMetadataCache.cache_data).where(*cache_filter))
+                if field_counts is not None:
+                    models_json, total = encode_models_list(client_id, cached_at, field_counts)
+
+        if models_json is None:
+            with metadata_refresh_lock(client_id, cache_key):
+                # Another request may have refreshed the cache while this one waited
+                cached = db.session.execute(
+                    select(ClientMetadataCache.cached_at, ClientMetadataCache.cache_data).where(*cache_filter)
+                ).first()
+
+                if cached:
+                    cached_at, field_counts = cached
+                else:
+                    # Get models from Acumatica (returns list of model names)
+                    model_names = acumatica_client.list_models()
+
+                    # Build models dict with basic info, then keep only the counts
+                    models = fetch_metadata(acumatica_client.get_model_info, model_names, 'fields')
+                    field_counts = {name: len(fields) if fields else 0 for name, fields in models.items()}
+
+                    # Update cache
+                    cached_at = store_metadata_cache(client_id, cache_key, field_counts, client.cache_ttl_hours or 24)
+
+                models_json, total = encode_models_list(client_id, cached_at, field_counts)
+
+        return client_envelope(
+            client_id,
+            (b'models', models_json),
+            (b'total', str(total).encode('ascii'))
+        )
 
     except Exception as e:
         return jsonify({
@@ -1018,83 +1654,139 @@ def get_client_model_details(client_id, model_name):
         client_id: UUID of the client
         model_name: Name of the model
 
+    Query Parameters:
+        - include: Comma-separated optional parts (schema, metadata, doc);
+          all of them when omitted
+
     Returns:
         JSON response with model details
     """
     try:
         # Get client from database first to validate it exists
-        client = Client.query.get(client_id)
-        if not client:
-            return jsonify({
-                'success': False,
-                'error': 'Client not found'
-            }), 404
+        is_active = db.session.scalar(select(Client.is_active).where(Client.id == client_id))
+        if is_active is None:
+            return json_error(_CLIENT_NOT_FOUND_BODY, 404)
 
-        if not client.is_active:
-            return jsonify({
-                'success': False,
-                'error': 'Client is inactive. Please activate it first.'
-            }), 400
+        if not is_active:
+            return json_error(_CLIENT_INACTIVE_BODY, 400)
 
         # Get connection from pool (creates if needed)
         acumatica_client = get_client_connection(client_id)
 
-        # Get the model class directly
+        # Get the model class from the connection's registry
         try:
-            if hasattr(acumatica_client, 'models'):
-                model_class = getattr(acumatica_client.models, model_name)
-            else:
-                return jsonify({
-                    'success': False,
-                    'error': 'Models not available'
-                }), 404
-        except AttributeError:
+            model_class = lookup_model(acumatica_client, model_name)
+        except LookupError:
+            return json_error(_MODELS_UNAVAILABLE_BODY, 404)
+
+        if model_class is None:
             return jsonify({
                 'success': False,
                 'error': f'Model {model_name} not found'
             }), 404
 
-        # Get model fields (for backward compatibility)
-        fields = []
-        if hasattr(model_class, '__dataclass_fields__'):
-            for field_name, field_obj in model_class.__dataclass_fields__.items():
-                field_info = {
-                    'name': field_name,
-                    'type': str(field_obj.type) if field_obj.type else 'Any',
-                    'required': field_obj.default is None and field_obj.default_factory is None
-                }
+        include = parse_model_include(request.args.get('include'))
+        model_json, etag = describe_model(model_class, model_name, include)
 
-                # Add metadata if available
-                if hasattr(field_obj, 'metadata') and field_obj.metadata:
-                    if 'description' in field_obj.metadata:
-                        field_info['description'] = field_obj.metadata['description']
-                    if 'max_length' in field_obj.metadata:
-                        field_info['max_length'] = field_obj.metadata['max_length']
+        use_msgpack = wants_msgpack()
+        if use_msgpack:
+            etag += '-msgpack'
 
-                fields.append(field_info)
+        # The ETag is computed once per model class; unchanged models are
+        # answered with a bodiless 304 before any response is assembled
+        if request.if_none_match.contains(etag):
+            response = Response(status=304)
+        elif use_msgpack:
+            response = model_msgpack_response(client_id, model_class, model_json, include)
+        else:
+            # Splice the cached model JSON into the envelope without re-encoding it
+            response = client_envelope(client_id, (b'model', model_json))
 
-        # Try to get schema using the new get_schema method from easy-acumatica 0.5.5
-        schema = None
-        try:
-            if hasattr(model_class, 'get_schema'):
-                schema = model_class.get_schema()
-        except (AttributeError, Exception) as e:
-            logger.warning(f"Could not get schema for model {model_name}: {e}")
+        response.set_etag(etag)
+        if MSGPACK_RESPONSES:
+            response.vary.add('Accept')
+        return response
 
+    except Exception as e:
+        logger.error("Failed to get model details: %s", e)
         return jsonify({
-            'success': True,
-            'client_id': str(client_id),
-            'model': {
-                'name': model_name,
-                'fields': fields,
-                'field_count': len(fields),
-                'schema': schema,  # New schema from get_schema()
-                'description': model_class.__doc__ if hasattr(model_class, '__doc__') and model_class.__doc__ else None
-            }
-        }), 200
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
+# Most models accepted by one batch details request
+MAX_MODEL_DETAILS_BATCH = 100
+
+
+@clients_bp.route('/<uuid:client_id>/models/details', methods=['POST'])
+@require_auth
+def get_client_models_details(client_id):
+    """
+    Get details of several models for a client in one request.
+    Uses a single client lookup and connection for the whole batch.
+
+    Args:
+        client_id: UUID of the client
+
+    Request Body:
+        - models: List of model names (at most MAX_MODEL_DETAILS_BATCH)
+        - include: Optional list of parts (schema, metadata, doc); all when omitted
+
+    Returns:
+        JSON response with model details in request order, plus the names
+        that were not found
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        model_names = data.get('models')
+        if not isinstance(model_names, list) or not all(isinstance(name, str) for name in model_names):
+            return jsonify({
+                'success': False,
+                'error': 'models must be a list of model names'
+            }), 400
+
+        if len(model_names) > MAX_MODEL_DETAILS_BATCH:
+            return jsonify({
+                'success': False,
+                'error': f'At most {MAX_MODEL_DETAILS_BATCH} models can be requested at once'
+            }), 400
+
+        # Get client from database first to validate it exists
+        is_active = db.session.scalar(select(Client.is_active).where(Client.id == client_id))
+        if is_active is None:
+            return json_error(_CLIENT_NOT_FOUND_BODY, 404)
+
+        if not is_active:
+            return json_error(_CLIENT_INACTIVE_BODY, 400)
+
+        # Get connection from pool (creates if needed)
+        acumatica_client = get_client_connection(client_id)
+
+        include = parse_model_include(data.get('include'))
+
+        # Collect the cached model fragments in request order
+        fragments = []
+        not_found = []
+        for model_name in model_names:
+            try:
+                model_class = lookup_model(acumatica_client, model_name)
+            except LookupError:
+                return json_error(_MODELS_UNAVAILABLE_BODY, 404)
+
+            if model_class is None:
+                not_found.append(model_name)
+            else:
+                fragments.append(describe_model(model_class, model_name, include)[0])
+
+        return client_envelope(
+            client_id,
+            (b'models', b'[' + b','.join(fragments) + b']'),
+            (b'not_found', dumps_bytes(not_found))
+        )
 
     except Exception as e:
-        logger.error(f"Failed to get model details: {e}")
+        logger.error("Failed to get model details: %s", e)
         return jsonify({
             'success': False,
             'error': str(e)
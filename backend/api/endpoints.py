@@ -6,10 +6,12 @@ Manages deployed endpoints for exposing Acumatica service methods as REST APIs.
 
 import logging
 from flask import Blueprint, request, jsonify
+from sqlalchemy.exc import IntegrityError
 from models import Endpoint, Client, EndpointExecution, ServiceGroup
-from database import db
+from database import db, is_unique_violation
 from auth import require_api_key
 from api.auth import require_auth
+from api.clients import service_method_names
 from services.endpoint_executor import EndpointExecutor
 from services.schema_service import SchemaService
 from services.connection_pool import get_connection_pool
@@ -92,19 +94,22 @@ def create_endpoint(client_id, service_group_id):
                 'error': 'service_name and method_name are required'
             }), 400
 
-        # Check if service group exists
+        # Check if service group exists (scoped to the client, so this also
+        # covers the client itself)
         service_group = ServiceGroup.query.filter_by(id=service_group_id, client_id=client_id).first()
         if not service_group:
             return jsonify({'success': False, 'error': 'Service group not found'}), 404
 
-        # Check if endpoint already exists in this service group
-        existing = Endpoint.query.filter_by(
-            service_group_id=service_group_id,
-            service_name=data['service_name'],
-            method_name=data['method_name']
-        ).first()
-
-        if existing:
+        # Check for an existing endpoint before connecting to Acumatica and
+        # generating schemas; the unique constraint (below) covers races
+        existing_id = db.session.scalar(
+            db.select(Endpoint.id).where(
+                Endpoint.service_group_id == service_group_id,
+                Endpoint.service_name == data['service_name'],
+                Endpoint.method_name == data['method_name']
+            )
+        )
+        if existing_id:
             return jsonify({
                 'success': False,
                 'error': 'Endpoint already exists for this service method in this service group'
@@ -147,8 +152,19 @@ def create_endpoint(client_id, service_group_id):
             log_retention_hours=data.get('log_retention_hours', 24)
         )
 
+        # A concurrent request creating the same endpoint is caught by
+        # unique_endpoint_per_service_group
         db.session.add(endpoint)
-        db.session.commit()
+        try:
+            db.session.commit()
+        except IntegrityError as e:
+            db.session.rollback()
+            if is_unique_violation(e, 'unique_endpoint_per_service_group'):
+                return jsonify({
+                    'success': False,
+                    'error': 'Endpoint already exists for this service method in this service group'
+                }), 409
+            return jsonify({'success': False, 'error': f'Invalid endpoint data: {e.orig}'}), 400
 
         logger.info(f"Created endpoint {endpoint.id} for {data['service_name']}.{data['method_name']}")
 
@@ -212,13 +228,20 @@ def deploy_service(client_id, service_group_id):
         # Get methods to deploy
         methods_to_deploy = data.get('methods', [])
         if not methods_to_deploy:
-            # Get all public methods
-            methods_to_deploy = [
-                method for method in dir(service_obj)
-                if not method.startswith('_') and callable(getattr(service_obj, method))
-            ]
+            # Get all public methods (the same list the service details page shows)
+            methods_to_deploy = service_method_names(service_obj)
+
+        # Methods already deployed in this service group (one query for all of them)
+        existing_methods = set(db.session.scalars(
+            db.select(Endpoint.method_name).where(
+                Endpoint.service_group_id == service_group_id,
+                Endpoint.service_name == data['service_name'],
+                Endpoint.method_name.in_(methods_to_deploy)
+            )
+        ))
 
         # Deploy each method
+        new_endpoints = []
         created_endpoints = []
         skipped_endpoints = []
         errors = []
@@ -226,13 +249,7 @@ def deploy_service(client_id, service_group_id):
         for method_name in methods_to_deploy:
             try:
                 # Check if already exists in this service group
-                existing = Endpoint.query.filter_by(
-                    service_group_id=service_group_id,
-                    service_name=data['service_name'],
-                    method_name=method_name
-                ).first()
-
-                if existing:
+                if method_name in existing_methods:
                     skipped_endpoints.append({
                         'method_name': method_name,
                         'reason': 'Already exists in this service group'
@@ -263,7 +280,8 @@ def deploy_service(client_id, service_group_id):
                     log_retention_hours=data.get('log_retention_hours', 24)
                 )
 
-                db.session.add(endpoint)
+                new_endpoints.append(endpoint)
+                existing_methods.add(method_name)
                 created_endpoints.append(method_name)
 
             except Exception as e:
@@ -273,7 +291,8 @@ def deploy_service(client_id, service_group_id):
                     'error': str(e)
                 })
 
-        # Commit all endpoints
+        # Insert all endpoints in one batch and commit
+        db.session.add_all(new_endpoints)
         db.session.commit()
 
         logger.info(f"Deployed {len(created_endpoints)} endpoints for service {data['service_name']}")
@@ -301,7 +320,7 @@ def deploy_service(client_id, service_group_id):
 def get_endpoint(endpoint_id):
     """Get details of a specific endpoint."""
     try:
-        endpoint = Endpoint.query.get(endpoint_id)
+        endpoint = db.session.get(Endpoint, endpoint_id)
 
         if not endpoint:
             return jsonify({'success': False, 'error': 'Endpoint not found'}), 404
@@ -336,7 +355,7 @@ def update_endpoint(endpoint_id):
         - log_retention_hours
     """
     try:
-        endpoint = Endpoint.query.get(endpoint_id)
+        endpoint = db.session.get(Endpoint, endpoint_id)
 
         if not endpoint:
             return jsonify({'success': False, 'error': 'Endpoint not found'}), 404
@@ -375,7 +394,7 @@ def update_endpoint(endpoint_id):
 def delete_endpoint(endpoint_id):
     """Delete an endpoint."""
     try:
-        endpoint = Endpoint.query.get(endpoint_id)
+        endpoint = db.session.get(Endpoint, endpoint_id)
 
         if not endpoint:
             return jsonify({'success': False, 'error': 'Endpoint not found'}), 404
@@ -401,7 +420,7 @@ def delete_endpoint(endpoint_id):
 def activate_endpoint(endpoint_id):
     """Activate an endpoint."""
     try:
-        endpoint = Endpoint.query.get(endpoint_id)
+        endpoint = db.session.get(Endpoint, endpoint_id)
 
         if not endpoint:
             return jsonify({'success': False, 'error': 'Endpoint not found'}), 404
@@ -427,7 +446,7 @@ def activate_endpoint(endpoint_id):
 def deactivate_endpoint(endpoint_id):
     """Deactivate an endpoint."""
     try:
-        endpoint = Endpoint.query.get(endpoint_id)
+        endpoint = db.session.get(Endpoint, endpoint_id)
 
         if not endpoint:
             return jsonify({'success': False, 'error': 'Endpoint not found'}), 404
@@ -463,7 +482,7 @@ def get_endpoint_logs(endpoint_id):
         - until: ISO timestamp - only logs before this time
     """
     try:
-        endpoint = Endpoint.query.get(endpoint_id)
+        endpoint = db.session.get(Endpoint, endpoint_id)
 
         if not endpoint:
             return jsonify({'success': False, 'error': 'Endpoint not found'}), 404
@@ -534,22 +553,33 @@ def test_endpoint(endpoint_id):
     Request body: Parameters to pass to the method
     """
     try:
-        endpoint = Endpoint.query.get(endpoint_id)
+        # Load just what the executor needs (skips the schema columns and the
+        # separate service group lookup)
+        row = db.session.execute(
+            db.select(
+                Endpoint.client_id,
+                Endpoint.service_name,
+                Endpoint.method_name,
+                ServiceGroup.name.label('service_group_name')
+            )
+            .outerjoin(ServiceGroup, ServiceGroup.id == Endpoint.service_group_id)
+            .where(Endpoint.id == endpoint_id)
+        ).first()
 
-        if not endpoint:
+        if not row:
             return jsonify({'success': False, 'error': 'Endpoint not found'}), 404
 
         request_body = request.get_json() or {}
 
         # Get service group name for the endpoint
-        service_group_name = endpoint.service_group.name if endpoint.service_group else 'default'
+        service_group_name = row.service_group_name or 'default'
 
         # Execute the endpoint
         response, status_code = EndpointExecutor.execute_endpoint(
-            str(endpoint.client_id),
+            str(row.client_id),
             service_group_name,
-            endpoint.service_name,
-            endpoint.method_name,
+            row.service_name,
+            row.method_name,
             request_body
         )
 
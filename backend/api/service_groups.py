@@ -58,7 +58,7 @@ def list_service_groups(client_id):
     """List all service groups for a client."""
     try:
         # Check if client exists
-        client = Client.query.get(client_id)
+        client = db.session.get(Client, client_id)
         if not client:
             return jsonify({'success': False, 'error': 'Client not found'}), 404
 
@@ -100,7 +100,7 @@ def create_service_group(client_id):
             return jsonify({'success': False, 'error': 'name is required'}), 400
 
         # Check if client exists
-        client = Client.query.get(client_id)
+        client = db.session.get(Client, client_id)
         if not client:
             return jsonify({'success': False, 'error': 'Client not found'}), 404
 
@@ -3,6 +3,7 @@ Orbu Backend API
 Flask application for managing multiple Acumatica connections
 """
 
+import atexit
 import os
 import sys
 from flask import Flask, jsonify
@@ -10,15 +11,17 @@ from flask_cors import CORS
 import logging
 
 # Import our modules
-from database import init_database
+from database import init_database, ensure_indexes
 from encryption import init_encryption
+from json_provider import OrjsonProvider
 from api.clients import clients_bp
 from api.endpoints import endpoints_bp
 from api.service_groups import service_groups_bp
-from api.auth import auth_bp, init_admin_user
+from api.auth import auth_bp, init_admin_user, flush_last_logins
 from api.updates import updates_bp
-from services.connection_pool import init_connection_pool
+from services.connection_pool import init_connection_pool, start_connection_pool_warmup
 from services.log_cleanup import log_cleanup_service
+from services.connection_log_writer import connection_log_writer
 from apscheduler.schedulers.background import BackgroundScheduler
 
 # Configure logging
@@ -30,6 +33,7 @@ logger = logging.getLogger(__name__)
 
 # Initialize Flask app
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
 # Configuration
 app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'dev-secret-key-change-me')
@@ -99,12 +103,21 @@ def root():
     })
 
 
+def run_with_app_context(func):
+    """Run a background job inside the Flask application context."""
+    with app.app_context():
+        return func()
+
+
 # Create database tables and initialize services
 with app.app_context():
     try:
         db.create_all()
         logger.info("Database tables created/verified")
 
+        # Indexes that create_all() can't add to existing tables
+        ensure_indexes()
+
         # Initialize admin user from environment variables
         init_admin_user()
 
@@ -112,6 +125,9 @@ with app.app_context():
         init_connection_pool()
         logger.info("Connection pool initialized")
 
+        # Pre-connect recently used clients (opt-in via POOL_WARMUP_CLIENTS)
+        start_connection_pool_warmup(app)
+
         # Initialize background scheduler for log cleanup
         scheduler = BackgroundScheduler()
         # Run cleanup every hour
@@ -123,8 +139,32 @@ with app.app_context():
             name='Clean up old endpoint execution logs',
             replace_existing=True
         )
+        # Batch last-login timestamps recorded by /api/auth/login
+        scheduler.add_job(
+            func=run_with_app_context,
+            args=[flush_last_logins],
+            trigger='interval',
+            seconds=1,
+            id='flush_last_logins',
+            name='Flush batched user last-login times',
+            replace_existing=True
+        )
+        # Batch connection audit logs queued by the clients API
+        scheduler.add_job(
+            func=run_with_app_context,
+            args=[connection_log_writer.flush],
+            trigger='interval',
+            seconds=1,
+            id='flush_connection_logs',
+            name='Flush queued connection logs',
+            replace_existing=True
+        )
         scheduler.start()
-        logger.info("Background scheduler started for log cleanup (runs every hour)")
+        logger.info("Background scheduler started (hourly log cleanup, per-second login/connection log flushes)")
+
+        # Write out last-login times and connection logs still queued when the worker exits
+        atexit.register(run_with_app_context, flush_last_logins)
+        atexit.register(run_with_app_context, connection_log_writer.flush)
 
     except Exception as e:
         logger.error(f"Failed to initialize application: {e}")
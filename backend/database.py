@@ -3,11 +3,15 @@ Database configuration and initialization for Orbu.
 Supports local PostgreSQL, Cloud SQL via Unix socket, and Cloud SQL via Python Connector.
 """
 
+import logging
 import os
 from urllib.parse import quote_plus
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import text
 from flask_migrate import Migrate
 
+logger = logging.getLogger(__name__)
+
 # Initialize SQLAlchemy without app
 db = SQLAlchemy()
 migrate = Migrate()
@@ -105,3 +109,77 @@ def init_database(app):
     migrate.init_app(app, db)
 
     return db
+
+
+# Indexes added after the initial schema. db.create_all() never alters an
+# existing table, so these are applied idempotently at startup as well.
+INDEX_DDL = (
+    # Trigram indexes backing the client search (ILIKE '%term%'). A btree index
+    # cannot serve a leading wildcard, but a gin_trgm_ops index can, so Postgres
+    # plans the existing ILIKE filters as bitmap index scans instead of seq scans.
+    ('trigram search indexes', (
+        "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+        "CREATE INDEX IF NOT EXISTS ix_clients_name_trgm ON clients USING gin (name gin_trgm_ops)",
+        "CREATE INDEX IF NOT EXISTS ix_clients_description_trgm ON clients USING gin (description gin_trgm_ops)",
+    )),
+    # list_clients: optional is_active filter, newest first (see Client.__table_args__)
+    ('client listing index', (
+        "CREATE INDEX IF NOT EXISTS ix_clients_active_created ON clients (is_active, created_at DESC)",
+    )),
+    # Endpoint listing per service group and client deletes (see Endpoint.__table_args__)
+    ('endpoint indexes', (
+        "CREATE INDEX IF NOT EXISTS ix_endpoints_group_created ON endpoints (service_group_id, created_at DESC)",
+        "CREATE INDEX IF NOT EXISTS ix_endpoints_client_id ON endpoints (client_id)",
+    )),
+)
+
+
+def ensure_indexes():
+    """
+    Create the indexes in INDEX_DDL if they do not exist yet.
+
+    Runs after db.create_all() so existing deployments pick the indexes up
+    too. Each group is applied separately; failures (e.g. no privilege to
+    create an extension) are logged and ignored, since queries still work
+    without the index.
+    """
+    for name, statements in INDEX_DDL:
+        try:
+            for statement in statements:
+                db.session.execute(text(statement))
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.warning("Could not create %s: %s", name, e)
+
+
+# SQLSTATE for unique_violation
+UNIQUE_VIOLATION = '23505'
+
+
+def is_unique_violation(error, constraint):
+    """
+    Check whether an IntegrityError was raised by a specific unique constraint.
+
+    Lets handlers report duplicates as 409 without also catching NOT NULL or
+    foreign key violations.
+
+    Args:
+        error: sqlalchemy.exc.IntegrityError
+        constraint: Name of the unique constraint (or unique index)
+
+    Returns:
+        bool: True if the error is a unique violation of that constraint
+    """
+    orig = getattr(error, 'orig', None)
+
+    # psycopg2
+    code = getattr(orig, 'pgcode', None)
+    name = getattr(getattr(orig, 'diag', None), 'constraint_name', None)
+
+    # pg8000 (Cloud SQL connector) passes the server's error fields as a dict
+    if code is None and orig is not None and orig.args and isinstance(orig.args[0], dict):
+        fields = orig.args[0]
+        code, name = fields.get('C'), fields.get('n')
+
+    return code == UNIQUE_VIOLATION and name == constraint
@@ -5,10 +5,15 @@ Uses Fernet symmetric encryption from the cryptography library.
 
 import os
 import base64
+from functools import lru_cache
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
+# Decrypted values kept per service. A ciphertext never changes meaning, and
+# updating a credential produces a new ciphertext, so entries never go stale.
+DECRYPT_CACHE_SIZE = 512
+
 
 class EncryptionService:
     """
@@ -37,6 +42,10 @@ class EncryptionService:
 
             self.fernet = Fernet(key.encode() if isinstance(key, str) else key)
 
+        # Reconnects and rebuilds decrypt the same stored credentials over and
+        # over; skip the HMAC check and AES pass for ones seen before
+        self._decrypt_cached = lru_cache(maxsize=DECRYPT_CACHE_SIZE)(self._decrypt_bytes)
+
     @staticmethod
     def generate_key():
         """
@@ -115,16 +124,17 @@ class EncryptionService:
             ciphertext = ciphertext.encode()
 
         try:
-            # Decrypt the data
-            decrypted = self.fernet.decrypt(ciphertext)
-
-            # Return as string
-            return decrypted.decode()
+            # Failures raise, so they are never cached
+            return self._decrypt_cached(ciphertext)
         except Exception as e:
             # Log the error (in production, use proper logging)
             print(f"Decryption error: {e}")
             return None
 
+    def _decrypt_bytes(self, ciphertext):
+        """Decrypt ciphertext bytes to a string, raising on invalid tokens."""
+        return self.fernet.decrypt(ciphertext).decode()
+
     def encrypt_dict(self, data):
         """
         Encrypt specific fields in a dictionary.
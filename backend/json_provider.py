@@ -0,0 +1,101 @@
+"""
+orjson-backed JSON provider for Flask.
+Replaces the stdlib json encoder used by jsonify() and request.get_json().
+"""
+
+import dataclasses
+import decimal
+import json
+import uuid
+from datetime import date
+
+import orjson
+from flask.json.provider import JSONProvider
+from werkzeug.http import http_date
+
+# Non-string dict keys are stringified like the stdlib encoder does; datetimes
+# are routed through _default so they keep Flask's HTTP-date format
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+
+def _default(o):
+    """Serialize the extra types Flask's default provider supports."""
+    if isinstance(o, date):
+        return http_date(o)
+
+    if isinstance(o, (decimal.Decimal, uuid.UUID)):
+        return str(o)
+
+    if dataclasses.is_dataclass(o) and not isinstance(o, type):
+        return dataclasses.asdict(o)
+
+    if hasattr(o, '__html__'):
+        return str(o.__html__())
+
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+def dumps_bytes(obj) -> bytes:
+    """
+    Serialize obj to UTF-8 JSON bytes.
+
+    Falls back to the stdlib encoder for values orjson rejects (e.g. integers
+    wider than 64 bits) so responses never fail where jsonify used to work.
+    """
+    try:
+        return orjson.dumps(obj, default=_default, option=ORJSON_OPTIONS)
+    except orjson.JSONEncodeError:
+        return json.dumps(obj, default=_default).encode('utf-8')
+
+
+def iter_json_list(fields, key, items):
+    """
+    Encode {**fields, key: [*items], 'total': n} incrementally.
+
+    Items are serialized one at a time so a large result set never has to
+    exist in memory as a whole list or as one encoded blob.
+
+    Args:
+        fields: Leading top-level fields (e.g. {'success': True}); must not be empty
+        key: Name of the list field
+        items: Iterable of JSON-serializable items
+
+    Yields:
+        UTF-8 encoded chunks of the JSON document
+    """
+    yield dumps_bytes(fields)[:-1] + b',' + dumps_bytes(key) + b':['
+
+    total = 0
+    for item in items:
+        if total:
+            yield b','
+        yield dumps_bytes(item)
+        total += 1
+
+    yield b'],"total":' + str(total).encode('ascii') + b'}'
+
+
+class OrjsonProvider(JSONProvider):
+    """
+    Flask JSON provider that encodes and decodes with orjson.
+
+    Usage:
+        app.json = OrjsonProvider(app)
+    """
+
+    mimetype = 'application/json'
+
+    def dumps(self, obj, **kwargs):
+        if kwargs:
+            kwargs.setdefault('default', _default)
+            return json.dumps(obj, **kwargs)
+        return dumps_bytes(obj).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return json.loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps_bytes(obj), mimetype=self.mimetype)
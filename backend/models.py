@@ -37,21 +37,33 @@ class User(db.Model):
     updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow)
     last_login_at = Column(DateTime(timezone=True))
 
-    def to_dict(self):
-        """Convert user to dictionary for API responses (never include password)."""
-        return {
+    def to_dict(self, include_settings=True):
+        """
+        Convert user to dictionary for API responses (never include password).
+
+        Args:
+            include_settings: Whether to include the user's settings (admin listings omit them)
+
+        Returns:
+            dict: User data as dictionary
+        """
+        data = {
             'id': str(self.id),
             'email': self.email,
             'name': self.name,
             'is_admin': self.is_admin,
             'is_active': self.is_active,
             'is_approved': self.is_approved,
-            'settings': self.settings or {},
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None,
             'last_login_at': self.last_login_at.isoformat() if self.last_login_at else None,
         }
 
+        if include_settings:
+            data['settings'] = self.settings or {}
+
+        return data
+
     def __repr__(self):
         return f'<User {self.email}>'
 
@@ -104,6 +116,62 @@ class Client(db.Model):
     updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     last_connected_at = Column(DateTime(timezone=True))
 
+    # Backs list_clients (optional is_active filter, newest first)
+    __table_args__ = (
+        db.Index('ix_clients_active_created', is_active, created_at.desc()),
+    )
+
+    # Columns serialized by to_dict(); encrypted credentials are never included
+    JSON_FIELDS = (
+        'id', 'name', 'description', 'base_url', 'tenant', 'branch', 'api_key',
+        'endpoint_name', 'endpoint_version', 'locale',
+        'verify_ssl', 'persistent_login', 'retry_on_idle_logout',
+        'timeout', 'rate_limit_calls_per_second',
+        'cache_methods', 'cache_ttl_hours',
+        'is_active', 'created_at', 'updated_at', 'last_connected_at',
+    )
+
+    @classmethod
+    def json_columns(cls):
+        """Return the mapped columns listed in JSON_FIELDS (for column-only selects)."""
+        return [getattr(cls, field) for field in cls.JSON_FIELDS]
+
+    @staticmethod
+    def serialize(obj):
+        """
+        Serialize a Client, or a result row selecting Client.json_columns().
+
+        Args:
+            obj: Client instance or row with attributes named after JSON_FIELDS
+
+        Returns:
+            dict: Client data as dictionary
+        """
+        return {
+            'id': str(obj.id),
+            'name': obj.name,
+            'description': obj.description,
+            'base_url': obj.base_url,
+            'tenant': obj.tenant,
+            'branch': obj.branch,
+            # Always show full API key for internal/authorized use
+            'api_key': str(obj.api_key),
+            'endpoint_name': obj.endpoint_name,
+            'endpoint_version': obj.endpoint_version,
+            'locale': obj.locale,
+            'verify_ssl': obj.verify_ssl,
+            'persistent_login': obj.persistent_login,
+            'retry_on_idle_logout': obj.retry_on_idle_logout,
+            'timeout': obj.timeout,
+            'rate_limit_calls_per_second': obj.rate_limit_calls_per_second,
+            'cache_methods': obj.cache_methods,
+            'cache_ttl_hours': obj.cache_ttl_hours,
+            'is_active': obj.is_active,
+            'created_at': obj.created_at.isoformat() if obj.created_at else None,
+            'updated_at': obj.updated_at.isoformat() if obj.updated_at else None,
+            'last_connected_at': obj.last_connected_at.isoformat() if obj.last_connected_at else None,
+        }
+
     def to_dict(self, include_sensitive=False, show_full_api_key=True):
         """
         Convert client to dictionary for API responses.
@@ -115,32 +183,7 @@ class Client(db.Model):
         Returns:
             dict: Client data as dictionary
         """
-        # Always show full API key for internal/authorized use
-        api_key_str = str(self.api_key)
-
-        data = {
-            'id': str(self.id),
-            'name': self.name,
-            'description': self.description,
-            'base_url': self.base_url,
-            'tenant': self.tenant,
-            'branch': self.branch,
-            'api_key': api_key_str,
-            'endpoint_name': self.endpoint_name,
-            'endpoint_version': self.endpoint_version,
-            'locale': self.locale,
-            'verify_ssl': self.verify_ssl,
-            'persistent_login': self.persistent_login,
-            'retry_on_idle_logout': self.retry_on_idle_logout,
-            'timeout': self.timeout,
-            'rate_limit_calls_per_second': self.rate_limit_calls_per_second,
-            'cache_methods': self.cache_methods,
-            'cache_ttl_hours': self.cache_ttl_hours,
-            'is_active': self.is_active,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
-            'last_connected_at': self.last_connected_at.isoformat() if self.last_connected_at else None,
-        }
+        data = Client.serialize(self)
 
         # Never return encrypted passwords
         # Username could be included if needed for display purposes
@@ -326,8 +369,14 @@ class Endpoint(db.Model):
 
     # Unique constraint - one endpoint per service_group/service/method combination
     # This allows the same endpoint to exist in different service groups
+    # The constraint's index also serves the endpoint lookups, which are all
+    # by service group, service and method
     __table_args__ = (
         db.UniqueConstraint('service_group_id', 'service_name', 'method_name', name='unique_endpoint_per_service_group'),
+        # Service group endpoint listing, newest first
+        db.Index('ix_endpoints_group_created', service_group_id, created_at.desc()),
+        # Cascading deletes and per-client scans (foreign keys aren't indexed automatically)
+        db.Index('ix_endpoints_client_id', client_id),
     )
 
     def get_url_path(self):
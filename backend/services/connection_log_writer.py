@@ -0,0 +1,117 @@
+"""
+Background writer for connection audit logs.
+Connect/disconnect/rebuild requests queue ConnectionLog rows here instead of
+committing them on the request path; a scheduler job inserts them in batches.
+"""
+
+import logging
+from datetime import datetime, timezone
+from threading import Lock
+
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+
+from database import db
+from models import ConnectionLog
+
+logger = logging.getLogger(__name__)
+
+# Most rows written per INSERT; anything beyond waits for the next flush
+MAX_BATCH_SIZE = 500
+
+# Queued rows are dropped past this point so a database outage can't grow
+# the queue without bound
+MAX_PENDING = 10000
+
+
+class ConnectionLogWriter:
+    """Queues ConnectionLog rows and writes them with one INSERT per batch."""
+
+    def __init__(self):
+        self._pending = []
+        self._lock = Lock()
+
+    def enqueue(self, client_id, event_type, success, error_message=None,
+                user_agent=None, ip_address=None):
+        """
+        Queue a connection log entry for the next flush.
+
+        The timestamp is taken now so entries keep their real event time.
+
+        Args:
+            client_id: UUID of the client
+            event_type: 'connect', 'disconnect', 'rebuild', ...
+            success: Whether the operation succeeded
+            error_message: Error text for failed operations
+            user_agent: Request User-Agent header
+            ip_address: Request remote address
+        """
+        row = {
+            'client_id': client_id,
+            'event_type': event_type,
+            'success': success,
+            'error_message': error_message,
+            'user_agent': user_agent,
+            'ip_address': ip_address,
+            'created_at': datetime.now(timezone.utc),
+        }
+
+        with self._lock:
+            if len(self._pending) >= MAX_PENDING:
+                logger.warning("Connection log queue full, dropping %s entry for client %s", event_type, client_id)
+                return
+            self._pending.append(row)
+
+    def flush(self):
+        """
+        Insert queued log entries in batches.
+        Must run inside an application context (called by the background scheduler).
+
+        Returns:
+            int: Number of entries written
+        """
+        written = 0
+
+        while True:
+            with self._lock:
+                batch = self._pending[:MAX_BATCH_SIZE]
+                del self._pending[:MAX_BATCH_SIZE]
+
+            if not batch:
+                return written
+
+            try:
+                db.session.execute(insert(ConnectionLog), batch)
+                db.session.commit()
+                written += len(batch)
+            except IntegrityError:
+                # A client was deleted before its entries were flushed; write
+                # the rest of the batch one row at a time and skip the orphans
+                db.session.rollback()
+                written += self._insert_individually(batch)
+            except Exception as e:
+                db.session.rollback()
+                logger.error("Failed to flush connection logs: %s", e)
+
+                # Put the batch back in front so the next run retries it
+                with self._lock:
+                    self._pending[:0] = batch
+                    del self._pending[MAX_PENDING:]
+                return written
+
+    @staticmethod
+    def _insert_individually(batch):
+        """Insert rows one by one, skipping any that violate constraints."""
+        written = 0
+        for row in batch:
+            try:
+                db.session.execute(insert(ConnectionLog), row)
+                db.session.commit()
+                written += 1
+            except IntegrityError:
+                db.session.rollback()
+        return written
+
+
+# Global instance
+connection_log_writer = ConnectionLogWriter()
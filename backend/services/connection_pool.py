@@ -6,14 +6,62 @@ Separate from session-based connections used for frontend management.
 """
 
 import logging
+import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
-from threading import Lock
+from threading import Lock, Thread
 from easy_acumatica import AcumaticaClient
+from requests.adapters import HTTPAdapter
+from database import db
 from models import Client
 from encryption import get_encryption_service
 
 logger = logging.getLogger(__name__)
 
+# Background threads for Acumatica logouts, so dropping a connection never
+# holds a request (or the pool lock) on a network round-trip
+LOGOUT_WORKERS = 8
+_logout_executor = ThreadPoolExecutor(max_workers=LOGOUT_WORKERS, thread_name_prefix='acumatica-logout')
+
+
+def _safe_logout(client_id, acumatica_client):
+    """Log out an Acumatica session, logging instead of raising on failure."""
+    try:
+        acumatica_client.logout()
+        logger.info(f"Logged out client {client_id}")
+    except Exception as e:
+        logger.warning(f"Error logging out client {client_id}: {e}")
+
+
+# Keep-alive HTTP connections per Acumatica host. Sized for the concurrent
+# metadata lookups in api.clients (METADATA_FETCH_WORKERS); requests' default
+# of 10 makes the extra threads discard their connections and redo TLS.
+HTTP_POOL_MAXSIZE = 16
+
+
+def size_http_pool(acumatica_client):
+    """
+    Give the client's requests session a larger keep-alive connection pool.
+
+    Existing retry settings are carried over. Clients without a requests
+    session are left as they are.
+
+    Args:
+        acumatica_client: AcumaticaClient instance, before login
+    """
+    session = getattr(acumatica_client, 'session', None)
+    if session is None or not hasattr(session, 'mount'):
+        return
+
+    for prefix in ('https://', 'http://'):
+        current = session.get_adapter(prefix)
+        session.mount(prefix, HTTPAdapter(
+            pool_connections=HTTP_POOL_MAXSIZE,
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+            max_retries=getattr(current, 'max_retries', 0)
+        ))
+
 
 class ConnectionPool:
     """
@@ -62,12 +110,9 @@ class ConnectionPool:
                     logger.info(f"Reusing existing connection for client {client_id}")
                     return acumatica_client
                 else:
-                    # Connection too old, disconnect and create new
+                    # Connection too old, disconnect (in the background) and create new
                     logger.info(f"Connection expired for client {client_id}, reconnecting")
-                    try:
-                        acumatica_client.logout()
-                    except Exception as e:
-                        logger.warning(f"Error logging out expired connection: {e}")
+                    _logout_executor.submit(_safe_logout, client_id, acumatica_client)
 
             # Create new connection
             logger.info(f"Creating new connection for client {client_id}")
@@ -91,8 +136,9 @@ class ConnectionPool:
         Raises:
             Exception if client not found or connection fails
         """
-        # Get client from database
-        client = Client.query.get(client_id)
+        # Get client from database; the identity map is keyed by UUID, so a
+        # row the calling request already loaded is reused without a query
+        client = db.session.get(Client, uuid.UUID(client_id))
         if not client:
             raise Exception(f"Client {client_id} not found")
 
@@ -126,6 +172,9 @@ class ConnectionPool:
             rate_limit_calls_per_second=client.rate_limit_calls_per_second,
         )
 
+        # Reuse TCP/TLS connections across concurrent Acumatica calls
+        size_http_pool(acumatica_client)
+
         # Login
         try:
             acumatica_client.login()
@@ -136,32 +185,34 @@ class ConnectionPool:
 
         return acumatica_client
 
-    def disconnect(self, client_id: str) -> bool:
+    def disconnect(self, client_id: str, wait: bool = False) -> bool:
         """
         Disconnect and remove a client from the pool.
 
+        The connection leaves the pool immediately; the Acumatica logout runs
+        on a background thread unless wait is set.
+
         Args:
             client_id: UUID of the client
+            wait: Block until the logout has completed (up to 5 seconds)
 
         Returns:
             True if disconnected, False if not in pool
         """
         with self._global_lock:
-            if client_id not in self._connections:
-                return False
+            entry = self._connections.pop(client_id, None)
 
-            acumatica_client, _ = self._connections[client_id]
+        if entry is None:
+            return False
 
+        future = _logout_executor.submit(_safe_logout, client_id, entry[0])
+        if wait:
             try:
-                acumatica_client.logout()
-                logger.info(f"Logged out client {client_id}")
-            except Exception as e:
-                logger.warning(f"Error logging out client {client_id}: {e}")
+                future.result(timeout=5)
+            except Exception:
+                logger.warning(f"Timed out waiting for client {client_id} to log out")
 
-            # Remove from pool
-            del self._connections[client_id]
-
-            return True
+        return True
 
     def disconnect_all(self):
         """Disconnect all clients in the pool."""
@@ -170,7 +221,7 @@ class ConnectionPool:
 
         for client_id in client_ids:
             try:
-                self.disconnect(client_id)
+                self.disconnect(client_id, wait=True)
             except Exception as e:
                 logger.error(f"Error disconnecting client {client_id}: {e}")
 
@@ -232,3 +283,66 @@ def init_connection_pool():
     _connection_pool = ConnectionPool()
     logger.info("Connection pool initialized")
     return _connection_pool
+
+
+def warm_connection_pool(app, limit=None, concurrency=None):
+    """
+    Pre-connect the most recently used active clients.
+
+    Saves the first request to each of those clients the Acumatica login.
+    Disabled unless POOL_WARMUP_CLIENTS is set, because every worker
+    process opens its own sessions and Acumatica licenses cap concurrent
+    API logins.
+
+    Args:
+        app: Flask application instance (connections need an app context)
+        limit: Number of clients to warm (default: POOL_WARMUP_CLIENTS env var)
+        concurrency: Parallel logins (default: WARMUP_CONCURRENCY env var)
+
+    Returns:
+        Number of connections established
+    """
+    if limit is None:
+        limit = int(os.getenv('POOL_WARMUP_CLIENTS', '0'))
+    if concurrency is None:
+        concurrency = int(os.getenv('WARMUP_CONCURRENCY', '4'))
+
+    if limit <= 0:
+        return 0
+
+    with app.app_context():
+        client_ids = [
+            str(client_id) for client_id in db.session.scalars(
+                db.select(Client.id)
+                .where(Client.is_active.is_(True))
+                .order_by(Client.last_connected_at.desc().nulls_last())
+                .limit(limit)
+            )
+        ]
+
+    if not client_ids:
+        return 0
+
+    pool = get_connection_pool()
+
+    def connect(client_id):
+        with app.app_context():
+            try:
+                pool.get_connection(client_id)
+                return True
+            except Exception as e:
+                logger.warning(f"Warmup connection failed for client {client_id}: {e}")
+                return False
+
+    with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(client_ids)))) as executor:
+        warmed = sum(executor.map(connect, client_ids))
+
+    logger.info(f"Connection pool warmed with {warmed}/{len(client_ids)} clients")
+    return warmed
+
+
+def start_connection_pool_warmup(app):
+    """Warm the connection pool in a background thread so startup isn't delayed."""
+    thread = Thread(target=warm_connection_pool, args=(app,), name='pool-warmup', daemon=True)
+    thread.start()
+    return thread
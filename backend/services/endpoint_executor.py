@@ -11,6 +11,7 @@ Handles execution of deployed endpoints, including:
 
 import logging
 import time
+from functools import lru_cache
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 from flask import request
@@ -46,49 +47,55 @@ class EndpointExecutor:
             Tuple of (response_dict, http_status_code)
         """
         start_time = time.time()
-        endpoint = None
+        endpoint_id = None
         execution_log = None
 
         try:
-            # Find the service group first
-            service_group = ServiceGroup.query.filter_by(
-                client_id=client_id,
-                name=service_group_name
+            # Find the service group and the endpoint within it in one query.
+            # Only the ids and flags are needed here, not the schema columns;
+            # the outer join tells a missing group apart from a missing endpoint.
+            row = db.session.execute(
+                db.select(
+                    ServiceGroup.is_active.label('group_active'),
+                    Endpoint.id.label('endpoint_id'),
+                    Endpoint.is_active.label('endpoint_active')
+                )
+                .outerjoin(Endpoint, db.and_(
+                    Endpoint.service_group_id == ServiceGroup.id,
+                    Endpoint.service_name == service_name,
+                    Endpoint.method_name == method_name
+                ))
+                .where(ServiceGroup.client_id == client_id, ServiceGroup.name == service_group_name)
             ).first()
 
-            if not service_group:
+            if not row:
                 return {
                     'success': False,
                     'error': f'Service group not found: {service_group_name}'
                 }, 404
 
             # Check if service group is active
-            if not service_group.is_active:
+            if not row.group_active:
                 return {
                     'success': False,
                     'error': 'Service group is inactive'
                 }, 403
 
-            # Find the endpoint within the service group
-            endpoint = Endpoint.query.filter_by(
-                service_group_id=service_group.id,
-                service_name=service_name,
-                method_name=method_name
-            ).first()
-
-            if not endpoint:
+            if row.endpoint_id is None:
                 return {
                     'success': False,
                     'error': f'Endpoint not found: {service_name}.{method_name}'
                 }, 404
 
             # Check if endpoint is active
-            if not endpoint.is_active:
+            if not row.endpoint_active:
                 return {
                     'success': False,
                     'error': 'Endpoint is inactive'
                 }, 403
 
+            endpoint_id = row.endpoint_id
+
             # Get connection from pool
             connection_pool = get_connection_pool()
             acumatica_client = connection_pool.get_connection(str(client_id))
@@ -134,7 +141,7 @@ class EndpointExecutor:
 
             # Create execution log
             execution_log = EndpointExecution(
-                endpoint_id=endpoint.id,
+                endpoint_id=endpoint_id,
                 executed_at=datetime.now(timezone.utc),
                 duration_ms=duration_ms,
                 status_code=200,
@@ -154,7 +161,7 @@ class EndpointExecutor:
                 'data': result,
                 'meta': {
                     'duration_ms': duration_ms,
-                    'endpoint_id': str(endpoint.id),
+                    'endpoint_id': str(endpoint_id),
                     'executed_at': datetime.now(timezone.utc).isoformat()
                 }
             }
@@ -165,10 +172,10 @@ class EndpointExecutor:
             logger.error(f"Unexpected error executing endpoint: {e}", exc_info=True)
 
             # Log failed execution
-            if endpoint:
+            if endpoint_id:
                 duration_ms = int((time.time() - start_time) * 1000)
                 execution_log = EndpointExecution(
-                    endpoint_id=endpoint.id,
+                    endpoint_id=endpoint_id,
                     executed_at=datetime.now(timezone.utc),
                     duration_ms=duration_ms,
                     status_code=500,
@@ -188,9 +195,10 @@ class EndpointExecutor:
             }, 500
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def _pascal_to_snake(name: str) -> str:
         """
-        Convert PascalCase to snake_case.
+        Convert PascalCase to snake_case (memoized; service names are a small set).
 
         Args:
             name: PascalCase string
@@ -87,7 +87,7 @@ class LogCleanupService:
             dict: Statistics about deleted logs
         """
         try:
-            endpoint = Endpoint.query.get(endpoint_id)
+            endpoint = db.session.get(Endpoint, endpoint_id)
             if not endpoint:
                 return {
                     'success': False,
@@ -7,9 +7,14 @@ Extracts parameter types and generates schemas from Acumatica service method sig
 import inspect
 import logging
 from typing import Any, Dict, List, Optional, get_type_hints, get_origin, get_args
+from weakref import WeakKeyDictionary
 
 logger = logging.getLogger(__name__)
 
+# Parsed method signatures per service class and method name. Service classes
+# are generated per client connection, so entries go away with the connection.
+_method_signatures = WeakKeyDictionary()
+
 
 class SchemaService:
     """Service for extracting and generating schemas from method signatures."""
@@ -483,6 +488,30 @@ class SchemaService:
 
         return example
 
+    @staticmethod
+    def get_cached_method_signature(service_obj, method_name: str) -> Dict[str, Any]:
+        """
+        Like get_method_signature, but reuses the result per service class.
+
+        Deploying a service introspects every method of the same class, and
+        redeploys repeat that; only the first lookup pays for the registry
+        parsing and inspect.signature. Failed lookups are not cached.
+
+        Args:
+            service_obj: The Acumatica service object
+            method_name: Name of the method to inspect
+
+        Returns:
+            Signature dict as returned by get_method_signature (shared; do not mutate)
+        """
+        signatures = _method_signatures.setdefault(type(service_obj), {})
+        signature = signatures.get(method_name)
+        if signature is None:
+            signature = SchemaService.get_method_signature(service_obj, method_name)
+            if 'error' not in signature:
+                signatures[method_name] = signature
+        return signature
+
     @staticmethod
     def get_complete_schema(service_obj, method_name: str) -> Dict[str, Any]:
         """
@@ -495,7 +524,7 @@ class SchemaService:
         Returns:
             Complete schema dict
         """
-        signature = SchemaService.get_method_signature(service_obj, method_name)
+        signature = SchemaService.get_cached_method_signature(service_obj, method_name)
 
         return {
             'method_name': method_name,